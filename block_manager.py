@@ -1,7 +1,27 @@
 from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
 from exp_config import BlockConfig
 
 
+@dataclass(slots=True)
+class Trial:
+    """Параметры одной попытки в последовательности блока
+
+    Слоты вместо словаря: чтение атрибута дешевле поиска по строковому
+    ключу, а попыток в эксперименте сотни.
+    """
+
+    task_type: int
+    speed: Optional[float]
+    duration: Optional[int]
+    trajectory_index: int
+    actual_trajectory_category: str  # Оригинальное название с _ если есть
+    block_name: str
+    trial_in_block: int
+    display_order: int
+    decoded_params: Dict[str, Any] = field(default_factory=dict)
+
+
 class BlockManager:
     def __init__(
         self,
@@ -52,7 +72,7 @@ class BlockManager:
 
     def _generate_trial_sequence_for_block(
         self, block: BlockConfig
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Trial]:
         """Генерирует последовательность попыток для конкретного блока"""
         trials = []
         block_data = self.trajectories_data[block.name]
@@ -80,17 +100,17 @@ class BlockManager:
 
             # Создаем попытки для всех траекторий в этой категории
             for trajectory_idx in range(len(trajectories)):
-                trial = {
-                    "task_type": decoded_params["task_index"],
-                    "speed": decoded_params["speed"],
-                    "duration": decoded_params["duration"],
-                    "trajectory_index": trajectory_idx,
-                    "actual_trajectory_category": category,  # Оригинальное название с _ если есть
-                    "decoded_params": decoded_params,
-                    "block_name": block.name,
-                    "trial_in_block": len(trials) + 1,
-                    "display_order": len(trials) + 1,
-                }
+                trial = Trial(
+                    task_type=decoded_params["task_index"],
+                    speed=decoded_params["speed"],
+                    duration=decoded_params["duration"],
+                    trajectory_index=trajectory_idx,
+                    actual_trajectory_category=category,
+                    decoded_params=decoded_params,
+                    block_name=block.name,
+                    trial_in_block=len(trials) + 1,
+                    display_order=len(trials) + 1,
+                )
                 trials.append(trial)
 
         print(f"    Всего создано {len(trials)} попыток для блока {block.name}")
@@ -103,14 +123,14 @@ class BlockManager:
         else:
             return None
 
-    def get_current_trial(self) -> Dict[str, Any]:
+    def get_current_trial(self) -> Optional[Trial]:
         """Возвращает текущую попытку"""
         if self.current_block_index < len(self.block_sequences):
             block_trials = self.block_sequences[self.current_block_index]
             if self.current_trial_index < len(block_trials):
                 return block_trials[self.current_trial_index]
 
-        return {}
+        return None
 
     def move_to_next_trial(self) -> bool:
         """Переходит к следующей попытке, возвращает True если блок завершен"""
@@ -158,7 +178,7 @@ class BlockManager:
         current_block = self.get_current_block()
         current_trial = self.get_current_trial()
 
-        if not current_block or not current_trial:
+        if current_block is None or current_trial is None:
             return {
                 "block_number": 0,
                 "total_blocks": len(self.blocks),
@@ -180,17 +200,15 @@ class BlockManager:
         return {
             "block_number": self.current_block_index + 1,
             "total_blocks": len(self.blocks),
-            "trial_in_block": current_trial["trial_in_block"],
-            "display_order": current_trial["display_order"],
+            "trial_in_block": current_trial.trial_in_block,
+            "display_order": current_trial.display_order,
             "total_trials_in_block": total_trials_in_block,
-            "block_name": current_trial[
-                "block_name"
-            ],  # Используем оригинальное имя блока
-            "task_type": current_trial["task_type"],
+            "block_name": current_trial.block_name,  # Используем оригинальное имя блока
+            "task_type": current_trial.task_type,
             "trajectory_category": current_block.name,
-            "actual_trajectory_category": current_trial["actual_trajectory_category"],
-            "trajectory_index": current_trial["trajectory_index"],
-            "speed": current_trial.get("speed"),
-            "duration": current_trial.get("duration"),
-            "decoded_params": current_trial.get("decoded_params", {}),
+            "actual_trajectory_category": current_trial.actual_trajectory_category,
+            "trajectory_index": current_trial.trajectory_index,
+            "speed": current_trial.speed,
+            "duration": current_trial.duration,
+            "decoded_params": current_trial.decoded_params,
         }
@@ -10,11 +10,67 @@ class DataCollector:
         self.current_trial_data: Dict[str, Any] = {}  # Данные текущей попытки
         self.all_trials_data: List[Dict[str, Any]] = []  # Все собранные данные
         self.trial_number = 0  # Счетчик попыток
+        self._reset_trial_events()
+
+    def _reset_trial_events(self) -> None:
+        """Сбрасывает буфер событий текущей попытки
+
+        События горячего пути (метки времени, нажатие пробела) пишутся
+        в обычные атрибуты без обращения к словарю; в словарь данных они
+        переносятся один раз при завершении попытки.
+        """
+        self._movement_start_time: Optional[int] = None
+        self._stimulus_start_time: Optional[int] = None
+        self._movement_end_time: Optional[int] = None
+        self._occlusion_start_time: Optional[int] = None
+        self._occlusion_zone: Optional[Dict[str, Any]] = None
+        self._space_press_time: Optional[int] = None
+        self._stopped_by_user: Optional[bool] = None
+        self._was_visible_when_stopped: Optional[bool] = None
+        self._actual_trajectory_duration: Optional[float] = None
+        self._reaction_time: Optional[int] = None
+        self._actual_response_time_movement: Optional[int] = None
+        self._actual_response_time_stimulus: Optional[int] = None
+
+    def _flush_trial_events(self) -> None:
+        """Переносит накопленные события попытки в словарь данных"""
+        if not self.current_trial_data:
+            return
+
+        data = self.current_trial_data
+        if self._movement_start_time is not None:
+            data["movement_start_time"] = self._movement_start_time
+        if self._stimulus_start_time is not None:
+            data["stimulus_start_time"] = self._stimulus_start_time
+        if self._movement_end_time is not None:
+            data["movement_end_time"] = self._movement_end_time
+        if self._occlusion_start_time is not None:
+            data["occlusion_start_time"] = self._occlusion_start_time
+        if self._occlusion_zone is not None:
+            data["occlusion_zone"] = self._occlusion_zone
+        if self._space_press_time is not None:
+            data["space_press_time"] = self._space_press_time
+        if self._stopped_by_user is not None:
+            data["stopped_by_user"] = self._stopped_by_user
+        if self._was_visible_when_stopped is not None:
+            data["was_visible_when_stopped"] = self._was_visible_when_stopped
+        if self._actual_trajectory_duration is not None:
+            data["actual_trajectory_duration"] = self._actual_trajectory_duration
+        if self._reaction_time is not None:
+            data["reaction_time"] = self._reaction_time
+        if self._actual_response_time_movement is not None:
+            data["actual_response_time_movement"] = self._actual_response_time_movement
+        if self._actual_response_time_stimulus is not None:
+            data["actual_response_time_stimulus"] = self._actual_response_time_stimulus
 
     def get_start_delay(self) -> int:
         """Возвращает задержку перед стартом из текущей попытки"""
         return self.current_trial_data.get("start_delay", 0)
 
+    def get_movement_start_time(self) -> Optional[int]:
+        """Возвращает время начала движения текущей попытки"""
+        return self._movement_start_time
+
     def start_new_trial(
         self,
         trajectory_type: str,
@@ -31,6 +87,7 @@ class DataCollector:
     ) -> None:
         """Начинает запись данных для новой попытки"""
         self.trial_number += 1
+        self._reset_trial_events()
         self.current_trial_data = {
             # Основная информация о попытке
             "trial_number": self.trial_number,
@@ -75,56 +132,43 @@ class DataCollector:
 
     def record_movement_start(self) -> None:
         """Записывает время начала движения"""
-        self.current_trial_data["movement_start_time"] = (
-            pygame.time.get_ticks()
-        )  # Текущее время в мс
+        self._movement_start_time = pygame.time.get_ticks()  # Текущее время в мс
 
     def record_stimulus_start(self) -> None:
         """Записывает время начала предъявления стимула"""
-        self.current_trial_data["stimulus_start_time"] = (
-            pygame.time.get_ticks()
-        )  # Текущее время в мс
+        self._stimulus_start_time = pygame.time.get_ticks()  # Текущее время в мс
 
     def record_movement_end(self) -> None:
         """Записывает время окончания движения"""
-        if not self.current_trial_data["movement_end_time"]:
-            self.current_trial_data["movement_end_time"] = (
-                pygame.time.get_ticks()
-            )  # Текущее время в мс
+        if self._movement_end_time is None:
+            self._movement_end_time = pygame.time.get_ticks()  # Текущее время в мс
 
     def record_space_press(
         self, stopped_by_user: bool = True, was_visible: bool = True
     ) -> None:
         """Записывает время нажатия пробела"""
         current_time = pygame.time.get_ticks()  # Текущее время в мс
-        self.current_trial_data["space_press_time"] = current_time
-        self.current_trial_data["stopped_by_user"] = stopped_by_user
-        self.current_trial_data["was_visible_when_stopped"] = (
-            was_visible  # Новая запись
-        )
+        self._space_press_time = current_time
+        self._stopped_by_user = stopped_by_user
+        self._was_visible_when_stopped = was_visible  # Новая запись
 
         # ЗАПИСЫВАЕМ ВРЕМЯ ОКОНЧАНИЯ ДВИЖЕНИЯ ДАЖЕ ПРИ ОСТАНОВКЕ ПОЛЬЗОВАТЕЛЕМ
-        if not self.current_trial_data["movement_end_time"]:
-            self.current_trial_data["movement_end_time"] = current_time
+        if self._movement_end_time is None:
+            self._movement_end_time = current_time
 
         # ВЫЧИСЛЯЕМ ФАКТИЧЕСКОЕ ВРЕМЯ ДВИЖЕНИЯ
-        if self.current_trial_data["movement_start_time"]:
-            movement_duration = (
-                current_time - self.current_trial_data["movement_start_time"]
-            )
-            self.current_trial_data["actual_trajectory_duration"] = movement_duration
+        if self._movement_start_time:
+            movement_duration = current_time - self._movement_start_time
+            self._actual_trajectory_duration = movement_duration
 
             # ЗАПИСЫВАЕМ ВРЕМЯ РЕАКЦИИ
-            self.current_trial_data["actual_response_time_movement"] = movement_duration
-            self.current_trial_data["reaction_time"] = movement_duration
+            self._actual_response_time_movement = movement_duration
+            self._reaction_time = movement_duration
 
         # Вычисляем время реакции от стимула (если есть)
-        if self.current_trial_data["stimulus_start_time"]:
-            self.current_trial_data["actual_response_time_stimulus"] = (
-                current_time
-                - self.current_trial_data[
-                    "stimulus_start_time"
-                ]  # Разница во времени в мс
+        if self._stimulus_start_time:
+            self._actual_response_time_stimulus = (
+                current_time - self._stimulus_start_time  # Разница во времени в мс
             )
 
     def record_reference_times(
@@ -166,12 +210,43 @@ class DataCollector:
 
     def record_trajectory_duration(self, actual_duration: float) -> None:
         """Записывает фактическое время прохождения траектории"""
-        self.current_trial_data["actual_trajectory_duration"] = (
+        self._actual_trajectory_duration = (
             actual_duration  # Число с плавающей точкой (мс)
         )
 
+    def record_regular_completion(
+        self, actual_duration: float, current_time: int
+    ) -> None:
+        """Записывает автоматическое завершение траектории одним вызовом
+
+        Объединяет record_space_press(stopped_by_user=False),
+        record_trajectory_duration и record_movement_end для горячего
+        пути завершения обычной задачи.
+        """
+        self._space_press_time = current_time
+        self._stopped_by_user = False
+        self._was_visible_when_stopped = True
+
+        if self._movement_end_time is None:
+            self._movement_end_time = current_time
+
+        self._actual_trajectory_duration = actual_duration
+
+        if self._movement_start_time:
+            movement_duration = current_time - self._movement_start_time
+            self._actual_response_time_movement = movement_duration
+            self._reaction_time = movement_duration
+
+        if self._stimulus_start_time:
+            self._actual_response_time_stimulus = (
+                current_time - self._stimulus_start_time
+            )
+
     def complete_trial(self, completed_normally: bool = False) -> None:
         """Завершает запись попытки"""
+        # Переносим буфер событий в словарь данных одним проходом
+        self._flush_trial_events()
+
         # Безопасная установка completed_normally
         if self.current_trial_data:
             self.current_trial_data["completed_normally"] = completed_normally
@@ -215,81 +290,90 @@ class DataCollector:
             self._print_trial_summary()
 
     def _print_trial_summary(self) -> None:
-        """Выводит сводку по завершенной попытке"""
+        """Выводит сводку по завершенной попытке
+
+        Строки собираются в список и пишутся в stdout одним вызовом
+        print: одна блокировка потока вывода на попытку вместо
+        полутора десятков, меньше пауза на границе попыток.
+        """
         trial = self.current_trial_data
-        
+
         if not trial:
             print("\n=== Попытка завершена (нет данных) ===")
             return
-        
+
         # Безопасное получение значений с значениями по умолчанию
         trial_number = trial.get("trial_number", "N/A")
         trajectory_type = trial.get("trajectory_type", "none")
         trajectory_number = trial.get("trajectory_number", 0)
         condition_type = trial.get("condition_type", "unknown")
-        
-        print(f"\n=== Попытка {trial_number} завершена ===")
-        print(f"Траектория: {trajectory_type}[{trajectory_number}]")
-        print(f"Условие: {condition_type}")
+
+        lines = [
+            f"\n=== Попытка {trial_number} завершена ===",
+            f"Траектория: {trajectory_type}[{trajectory_number}]",
+            f"Условие: {condition_type}",
+        ]
 
         # ДОБАВЛЯЕМ: информацию о задержке
         start_delay = trial.get("start_delay", 0)
         if start_delay > 0:
-            print(f"Задержка перед стартом: {start_delay}мс")
+            lines.append(f"Задержка перед стартом: {start_delay}мс")
 
         reaction_time = trial.get("reaction_time")
         if reaction_time:
-            print(f"Время реакции: {reaction_time}мс")
+            lines.append(f"Время реакции: {reaction_time}мс")
 
         stopped_by_user = trial.get("stopped_by_user", False)
         if stopped_by_user:
-            print("Остановлено пользователем")
+            lines.append("Остановлено пользователем")
         else:
-            print("Завершено автоматически")
+            lines.append("Завершено автоматически")
 
         actual_response_time_movement = trial.get("actual_response_time_movement")
         if actual_response_time_movement:
-            print(f"Время от движения до ответа: {actual_response_time_movement}мс")
+            lines.append(f"Время от движения до ответа: {actual_response_time_movement}мс")
 
         actual_response_time_stimulus = trial.get("actual_response_time_stimulus")
         if actual_response_time_stimulus:
-            print(f"Время от стимула до ответа: {trial['actual_response_time_stimulus']}мс")
+            lines.append(f"Время от стимула до ответа: {actual_response_time_stimulus}мс")
 
         actual_trajectory_duration = trial.get("actual_trajectory_duration")
         if actual_trajectory_duration:
-            print(f"Фактическое время движения: {actual_trajectory_duration}мс")
+            lines.append(f"Фактическое время движения: {actual_trajectory_duration}мс")
 
         reference_response_time = trial.get("reference_response_time")
         if reference_response_time:
-            print(f"Эталонное время: {reference_response_time}мс")
+            lines.append(f"Эталонное время: {reference_response_time}мс")
 
         # Добавляем информацию об оценке времени, если она есть
         timing_estimation = trial.get("timing_estimation")
         if timing_estimation:
-            print(f"Оценка времени:")
-            print(f"  Фактическое время: {timing_estimation.get('actual_duration', 'N/A')}мс")
-            print(f"  Оцененное время: {timing_estimation.get('estimated_duration', 'N/A')}мс")
-            print(f"  Ошибка: {timing_estimation.get('estimation_error', 'N/A')}мс")
-            print(f"  Абсолютная ошибка: {timing_estimation.get('estimation_error_abs', 'N/A')}мс")
+            lines.append("Оценка времени:")
+            lines.append(f"  Фактическое время: {timing_estimation.get('actual_duration', 'N/A')}мс")
+            lines.append(f"  Оцененное время: {timing_estimation.get('estimated_duration', 'N/A')}мс")
+            lines.append(f"  Ошибка: {timing_estimation.get('estimation_error', 'N/A')}мс")
+            lines.append(f"  Абсолютная ошибка: {timing_estimation.get('estimation_error_abs', 'N/A')}мс")
             estimation_ratio = timing_estimation.get('estimation_ratio')
             if estimation_ratio:
-                print(f"  Отношение: {estimation_ratio:.2f}")
+                lines.append(f"  Отношение: {estimation_ratio:.2f}")
             else:
-                print(f"  Отношение: N/A")
+                lines.append("  Отношение: N/A")
 
         # Добавляем информацию о воспроизведении времени, если она есть
         reproduction_results = trial.get("reproduction_results")
         if reproduction_results:
-            print(f"Воспроизведение времени:")
-            print(f"  Целевая длительность: {reproduction_results.get('target_duration', 'N/A')}мс")
-            print(f"  Воспроизведенная длительность: {reproduction_results.get('reproduced_duration', 'N/A')}мс")
-            print(f"  Ошибка: {reproduction_results.get('reproduction_error', 'N/A')}мс")
-            print(f"  Абсолютная ошибка: {reproduction_results.get('reproduction_error_abs', 'N/A')}мс")
+            lines.append("Воспроизведение времени:")
+            lines.append(f"  Целевая длительность: {reproduction_results.get('target_duration', 'N/A')}мс")
+            lines.append(f"  Воспроизведенная длительность: {reproduction_results.get('reproduced_duration', 'N/A')}мс")
+            lines.append(f"  Ошибка: {reproduction_results.get('reproduction_error', 'N/A')}мс")
+            lines.append(f"  Абсолютная ошибка: {reproduction_results.get('reproduction_error_abs', 'N/A')}мс")
             reproduction_ratio = reproduction_results.get('reproduction_ratio')
             if reproduction_ratio:
-                print(f"  Отношение: {reproduction_ratio:.2f}")
+                lines.append(f"  Отношение: {reproduction_ratio:.2f}")
             else:
-                print(f"  Отношение: N/A")
+                lines.append("  Отношение: N/A")
+
+        print("\n".join(lines))
 
     def get_all_data(self) -> List[Dict[str, Any]]:
         """Возвращает все собранные данные"""
@@ -309,13 +393,13 @@ class DataCollector:
     def record_occlusion_start(self, moving_point) -> None:
         """Записывает время начала окклюзии и информацию о зоне"""
         current_time = pygame.time.get_ticks()  # Текущее время в мс
-        self.current_trial_data["occlusion_start_time"] = current_time
+        self._occlusion_start_time = current_time
 
         # Записываем информацию о зоне окклюзии
         occlusion_info = (
             moving_point.get_occlusion_info()
         )  # Словарь с информацией об окклюзии
-        self.current_trial_data["occlusion_zone"] = {
+        self._occlusion_zone = {
             "start_segment": occlusion_info[
                 "start_segment"
             ],  # Номер сегмента начала (целое число)
@@ -31,6 +31,17 @@ class TaskConfig:
         self.reproduction_task = reproduction_task
         self.reproduction_duration = reproduction_duration
 
+        # Тип условия вычисляется один раз на задачу, а не на каждую
+        # попытку - комбинаций всего несколько
+        if reproduction_task:
+            self.condition_type = "reproduction"
+        elif timing_estimation:
+            self.condition_type = "timing_estimation"
+        elif occlusion_enabled:
+            self.condition_type = f"occlusion_{occlusion_type}"
+        else:
+            self.condition_type = "no_occlusion"
+
     def to_dict(self) -> Dict[str, Any]:
         """Возвращает настройки задачи в виде словаря"""
         return {
@@ -72,6 +83,10 @@ class ExperimentConfig:
         self.fixation_color: Tuple[int, int, int] = (0, 0, 0)
         self.participant_id = "test_01"
 
+        # Безголовый режим (CI/пакетные прогоны): пропускаем обращения
+        # к SDL, которые требуют реального дисплея
+        self.headless = False
+
         # Настройки фото-сенсора
         self.photo_sensor_radius = 20
         self.photo_sensor_offset_x = -80
@@ -127,6 +142,12 @@ class ExperimentConfig:
             BlockConfig("Последовательные категории", {}, "sequential"),
         ]
 
+        # Единая резервная конфигурация для некорректного task_index:
+        # создается один раз, а не на каждый вызов get_current_task_config
+        self._default_task = TaskConfig(
+            "Задача по умолчанию", FixationShape.TRIANGLE, True, True, "half"
+        )
+
     def decode_category(self, category: str) -> Dict[str, Any]:
         """Декодирует категорию траектории в параметры задачи"""
         if len(category) != 6:  # Формат: C1S1D1
@@ -189,9 +210,7 @@ class ExperimentConfig:
         if 0 <= task_index < len(self.tasks):
             return self.tasks[task_index]
         else:
-            return TaskConfig(
-                "Задача по умолчанию", FixationShape.TRIANGLE, True, True, "half"
-            )
+            return self._default_task
 
     def get_total_tasks(self) -> int:
         """Возвращает общее количество задач"""
@@ -259,6 +278,7 @@ class ExperimentConfig:
             "fixation_size": self.fixation_size,
             "fixation_color": self.fixation_color,
             "participant_id": self.participant_id,
+            "headless": self.headless,
             "photo_sensor_radius": self.photo_sensor_radius,
             "photo_sensor_offset_x": self.photo_sensor_offset_x,
             "photo_sensor_offset_y": self.photo_sensor_offset_y,
@@ -292,6 +312,7 @@ class ExperimentConfig:
             self.fixation_color = (0, 0, 0)
 
         self.participant_id = config_dict.get("participant_id", "test_01")
+        self.headless = config_dict.get("headless", False)
 
         # Настройки фото-сенсора
         self.photo_sensor_radius = config_dict.get("photo_sensor_radius", 20)
@@ -20,6 +20,10 @@ class InstructionScreen:
         self.custom_title = ""
         self.custom_instructions = []
 
+        # Готовый кадр инструкции: перенос строк и растеризация текста
+        # выполняются один раз при первом показе, а не на каждом кадре
+        self._rendered = None
+
     def activate(self) -> None:
         """Активирует экран с инструкцией"""
         self.is_active = True
@@ -40,23 +44,32 @@ class InstructionScreen:
         """Устанавливает пользовательское содержимое для инструкции"""
         self.custom_title = title
         self.custom_instructions = instructions
+        # Содержимое сменилось - готовый кадр больше не актуален
+        self._rendered = None
 
     def draw(self, screen: pygame.Surface) -> None:
         """Рисует экран с инструкцией - полноэкранный режим"""
         if not self.is_active:
             return
 
-        # Полностью заполняем экран фоном инструкции
-        screen.fill(self.background_color)
+        if self._rendered is None:
+            # Собираем полный кадр один раз; дальше только blit
+            rendered = pygame.Surface(
+                (self.screen_width, self.screen_height)
+            ).convert()
+            rendered.fill(self.background_color)
+
+            # Отступы от краев экрана
+            padding = min(self.screen_width, self.screen_height) // 20
 
-        # Отступы от краев экрана
-        padding = min(self.screen_width, self.screen_height) // 20
+            # Если установлено пользовательское содержимое, рисуем его
+            if self.custom_title:
+                self._draw_custom_content(rendered, padding)
+            else:
+                self._draw_default_content(rendered)
+            self._rendered = rendered
 
-        # Если установлено пользовательское содержимое, рисуем его
-        if hasattr(self, "custom_title") and self.custom_title:
-            self._draw_custom_content(screen, padding)
-        else:
-            self._draw_default_content(screen)
+        screen.blit(self._rendered, (0, 0))
 
     def _draw_custom_content(self, screen: pygame.Surface, padding: int) -> None:
         """Рисует пользовательское содержимое инструкции на весь экран"""
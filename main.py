@@ -1,18 +1,33 @@
 import pygame
 import sys
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from typing import Dict, Any, Optional
 from fixation import FixationCross, FixationShape
 from trajectory import TrajectoryManager
-from moving_point import MovingPoint
 from instruction_screen import InstructionScreen
 from data_collector import DataCollector
 from exp_config import ExperimentConfig
 from utils import load_trajectories, save_experiment_data
 from timing_estimation import TimingEstimationScreen
 from reproduction_task import ReproductionTask
-from block_manager import BlockManager
+from block_manager import BlockManager, Trial
 from block_summary import BlockSummaryScreen
 
+# Типы событий, которые обрабатывает основной цикл; остальные
+# (движение мыши и т.п.) отбрасываются на стороне SDL
+_QUIT = pygame.QUIT
+_KEYDOWN = pygame.KEYDOWN
+_HANDLED_EVENT_TYPES = (_QUIT, _KEYDOWN)
+
+# Отладочные сообщения горячего пути (переходы попыток) идут через
+# logging с отложенным %-форматированием: при уровне WARNING строки
+# вообще не собираются и stdout не блокируется на каждом переходе.
+# Для отладки поднимите уровень до DEBUG.
+log = logging.getLogger("time_exp")
+
 
 class FixationPreviewScreen:
     """Экран предварительного показа фиксационной точки перед траекторией"""
@@ -32,6 +47,23 @@ class FixationPreviewScreen:
         )
         self.fixation_preview.set_color((0, 0, 0))
 
+        # Обе строки инструкции фиксированы - растеризуем их один раз
+        # вместе с позицией, вместо создания шрифта на каждом кадре
+        font = pygame.font.Font(None, 36)
+        text_center = (screen_width // 2, screen_height - 50)
+        self._instruction_task = font.render(
+            "Нажмите ПРОБЕЛ чтобы начать задачу", True, (0, 0, 0)
+        )
+        self._instruction_task_rect = self._instruction_task.get_rect(
+            center=text_center
+        )
+        self._instruction_move = font.render(
+            "Нажмите ПРОБЕЛ чтобы начать движение точки", True, (0, 0, 0)
+        )
+        self._instruction_move_rect = self._instruction_move.get_rect(
+            center=text_center
+        )
+
     def show(self, fixation_shape: FixationShape, show_trajectory: bool = True) -> None:
         """Показывает фиксационную точку и траекторию (если нужно)"""
         self.showing = True
@@ -40,12 +72,14 @@ class FixationPreviewScreen:
         self.fixation_preview.set_shape(fixation_shape)
 
         if show_trajectory:
-            print(
-                f"Показана фиксационная точка {fixation_shape.value} и траектория (ожидание пробела)"
+            log.debug(
+                "Показана фиксационная точка %s и траектория (ожидание пробела)",
+                fixation_shape.value,
             )
         else:
-            print(
-                f"Показана фиксационная точка {fixation_shape.value} (ожидание пробела)"
+            log.debug(
+                "Показана фиксационная точка %s (ожидание пробела)",
+                fixation_shape.value,
             )
 
     def hide(self) -> None:
@@ -71,30 +105,28 @@ class FixationPreviewScreen:
         # Рисуем фиксационную точку в центре
         self.fixation_preview.draw(screen)
 
-        # Инструкция для пользователя
+        # Инструкция для пользователя: выбираем готовую поверхность
+        # в зависимости от типа задачи
         if self.instruction_shown:
-            font = pygame.font.Font(None, 36)
-
-            # Разные инструкции в зависимости от типа задачи
             current_shape = getattr(self.fixation_preview, "shape", None)
             if current_shape == FixationShape.CROSS:
-                instruction_text = font.render(
-                    "Нажмите ПРОБЕЛ чтобы начать задачу", True, (0, 0, 0)
-                )
+                screen.blit(self._instruction_task, self._instruction_task_rect)
             else:
-                instruction_text = font.render(
-                    "Нажмите ПРОБЕЛ чтобы начать движение точки", True, (0, 0, 0)
-                )
-
-            text_rect = instruction_text.get_rect(
-                center=(self.screen_width // 2, self.screen_height - 50)
-            )
-            screen.blit(instruction_text, text_rect)
+                screen.blit(self._instruction_move, self._instruction_move_rect)
 
 
 class ExperimentState:
     """Класс для управления состоянием эксперимента"""
 
+    __slots__ = (
+        "waiting_for_initial_start",
+        "waiting_for_movement_start",
+        "in_start_delay",
+        "movement_started",
+        "occlusion_started",
+        "running",
+    )
+
     def __init__(self) -> None:
         self.waiting_for_initial_start = True
         self.waiting_for_movement_start = (
@@ -109,43 +141,53 @@ class ExperimentState:
 class KeyHandler:
     """Класс для обработки клавиш"""
 
+    __slots__ = ("experiment", "_space_dispatch")
+
     def __init__(self, experiment) -> None:
         self.experiment = experiment
         self.setup_key_handlers()
 
     def setup_key_handlers(self) -> None:
         """Настройка обработчиков клавиш"""
-        self.key_handlers = {
-            pygame.K_ESCAPE: self.handle_escape,
-            pygame.K_SPACE: self.handle_space,
-            pygame.K_h: self.handle_help,
-            pygame.K_s: self.handle_save,
+        # Диспетчеризация пробела по фазе эксперимента: выбор
+        # обработчика одним поиском вместо повторной цепочки if/elif
+        self._space_dispatch = {
+            "initial": self._space_initial,
+            "waiting_for_start": self._space_waiting_for_start,
+            "moving": self._space_moving,
         }
 
     def handle_event(self, event) -> bool:
-        """Обработка события клавиши"""
-        # Скрытая комбинация Ctrl+M для переключения режима
-        if (
-            event.type == pygame.KEYDOWN
-            and event.key == pygame.K_m
-            and pygame.key.get_mods() & pygame.KMOD_CTRL
-        ):
-            self.experiment.toggle_minimal_mode()
-            return True
-
-        # Обычные обработчики клавиш
-        if event.type == pygame.KEYDOWN:
-            handler = self.key_handlers.get(event.key)
-            if handler:
-                handler()
-                return True
-        return False
+        """Обработка события клавиши (вызывается только для KEYDOWN)"""
+        # Набор клавиш мал и фиксирован: прямая лестница сравнений,
+        # упорядоченная по частоте (пробел нажимается в каждой попытке),
+        # дешевле поиска по словарю
+        key = event.key
+        if key == pygame.K_SPACE:
+            self.handle_space(event)
+        elif key == pygame.K_ESCAPE:
+            self.handle_escape(event)
+        elif key == pygame.K_h:
+            self.handle_help(event)
+        elif key == pygame.K_s:
+            self.handle_save(event)
+        elif key == pygame.K_m:
+            self.handle_mode_toggle(event)
+        else:
+            return False
+        return True
 
-    def handle_escape(self) -> None:
+    def handle_escape(self, event) -> None:
         """Обработка выхода"""
         self.experiment.state.running = False
 
-    def handle_space(self) -> None:
+    def handle_mode_toggle(self, event) -> None:
+        """Скрытая комбинация Ctrl+M для переключения режима"""
+        # Модификаторы берем из самого события, без вызова get_mods()
+        if event.mod & pygame.KMOD_CTRL:
+            self.experiment.toggle_minimal_mode()
+
+    def handle_space(self, event) -> None:
         """Обработка пробела"""
         exp = self.experiment
 
@@ -153,68 +195,92 @@ class KeyHandler:
         if exp.reproduction_task.is_active:
             return
 
+        handler = self._space_dispatch.get(self._get_space_phase())
+        if handler:
+            handler()
+
+    def _get_space_phase(self) -> Optional[str]:
+        """Определяет фазу эксперимента для диспетчеризации пробела"""
+        exp = self.experiment
+
         if (
             exp.state.waiting_for_initial_start
             and exp.initial_instruction_screen.is_active
         ):
-            exp.initial_instruction_screen.deactivate()
-            exp.state.waiting_for_initial_start = False
-            print("Эксперимент начат!")
+            return "initial"
+        if exp.state.waiting_for_movement_start:
+            return "waiting_for_start"
+        if self._can_stop_point():
+            return "moving"
+        return None
 
-            # После начальной инструкции показываем фиксационную точку и траекторию
-            exp.start_trial_preparation()
+    def _space_initial(self) -> None:
+        """Пробел на начальной инструкции"""
+        exp = self.experiment
 
-        elif exp.state.waiting_for_movement_start:
-            # Нажатие пробела для начала
-            print(f"Начало задачи")
-
-            if exp.current_task.reproduction_task:
-                # Для задачи воспроизведения СРАЗУ начинаем задачу
-                exp.state.waiting_for_movement_start = False
-                exp.fixation_preview_screen.hide()  # Скрываем превью
-
-                # Получаем назначенную длительность
-                assigned_duration = (
-                    exp.current_trial["duration"]
-                    if exp.current_trial["duration"] is not None
-                    else exp.config.available_durations[0]
-                )
+        exp.initial_instruction_screen.deactivate()
+        exp.state.waiting_for_initial_start = False
+        print("Эксперимент начат!")
 
-                print(
-                    f"Запуск задачи воспроизведения с длительностью {assigned_duration}мс"
-                )
+        # После начальной инструкции показываем фиксационную точку и траекторию
+        exp.start_trial_preparation()
+        exp._refresh_trial_active()
+
+    def _space_waiting_for_start(self) -> None:
+        """Пробел в ожидании начала задачи"""
+        exp = self.experiment
 
-                # СРАЗУ активируем задачу, она сама покажет первый крестик
-                exp.reproduction_task.activate(assigned_duration)
+        log.debug("Начало задачи")
 
-            else:
-                # Для задач с траекторией: начинаем движение с задержкой
-                print(f"Запуск задачи с траекторией")
-                exp.start_movement_with_delay()
+        if exp.current_task.reproduction_task:
+            # Для задачи воспроизведения СРАЗУ начинаем задачу
+            exp.state.waiting_for_movement_start = False
+            exp.fixation_preview_screen.hide()  # Скрываем превью
 
-        elif self._can_stop_point():
-            print(f"Остановка точки")
-            exp.stop_moving_point()
+            # Получаем назначенную длительность
+            assigned_duration = (
+                exp.current_trial.duration
+                if exp.current_trial.duration is not None
+                else exp.config.available_durations[0]
+            )
 
-    def handle_help(self) -> None:
+            log.debug(
+                "Запуск задачи воспроизведения с длительностью %sмс", assigned_duration
+            )
+
+            # СРАЗУ активируем задачу, она сама покажет первый крестик
+            exp.reproduction_task.activate(assigned_duration)
+
+        else:
+            # Для задач с траекторией: начинаем движение с задержкой
+            log.debug("Запуск задачи с траекторией")
+            exp.start_movement_with_delay()
+
+        exp._refresh_trial_active()
+
+    def _space_moving(self) -> None:
+        """Пробел во время движения точки"""
+        log.debug("Остановка точки")
+        self.experiment.stop_moving_point()
+
+    def handle_help(self, event) -> None:
         """Показать справку"""
         if self._can_show_help():
             self.experiment.show_help_info()
 
-    def handle_save(self) -> None:
+    def handle_save(self, event) -> None:
         """Сохранить данные"""
         if self._can_save():
             self.experiment.save_current_data()
 
     def _can_stop_point(self) -> bool:
         """Проверка возможности остановки точки"""
+        # Статичная часть условий кэширована в _ui_unlocked и
+        # пересчитывается только на переходах состояния; вживую
+        # проверяются лишь флаги самой точки
         exp = self.experiment
         return (
-            not exp.state.waiting_for_initial_start
-            and not exp.state.waiting_for_movement_start
-            and not exp.state.in_start_delay  # Нельзя останавливать во время задержки
-            and not exp.timing_screen.is_active
-            and not exp.reproduction_task.is_active
+            exp._ui_unlocked
             and exp.moving_point is not None
             and exp.moving_point.is_moving
             and not exp.moving_point.stopped_by_user
@@ -224,38 +290,74 @@ class KeyHandler:
 
     def _can_show_help(self) -> bool:
         """Проверка возможности показа справки"""
-        exp = self.experiment
-        return (
-            not exp.state.waiting_for_initial_start
-            and not exp.state.waiting_for_movement_start
-            and not exp.state.in_start_delay
-            and not exp.timing_screen.is_active
-            and not exp.reproduction_task.is_active
-        )
+        return self.experiment._ui_unlocked
 
     def _can_save(self) -> bool:
         """Проверка возможности сохранения"""
         return self._can_show_help()
 
 
+class ScreenKind(IntEnum):
+    """Типы экранов эксперимента (индексы в таблице отрисовки)"""
+
+    INITIAL_INSTRUCTION = 0
+    TIMING = 1
+    REPRODUCTION = 2
+    CROSS_FOR_STAR = 3
+    WAITING_FOR_START = 4
+    START_DELAY = 5
+    MAIN = 6
+
+
+class PhotoSensor(IntEnum):
+    """Состояния индикатора фото-сенсора (индексы в кэше поверхностей)
+
+    Состояние сравнивается и переключается на каждом кадре движения -
+    целочисленное сравнение вместо строкового.
+    """
+
+    ACTIVE = 0
+    PASSIVE = 1
+    OCCLUSION = 2
+
+
 class ScreenManager:
     """Класс для управления экранами"""
 
+    __slots__ = (
+        "experiment",
+        "screen_handlers",
+        "show_debug",
+        "_cross_instruction",
+        "_cross_instruction_rect",
+    )
+
     def __init__(self, experiment):
         self.experiment = experiment
-        self.screen_handlers = {
-            "initial_instruction": self.draw_initial_instruction,
-            "timing": self.draw_timing_screen,
-            "reproduction": self.draw_reproduction_task,
-            "cross_for_star": self.draw_cross_for_star,
-            "waiting_for_start": self.draw_waiting_for_start,
-            "start_delay": self.draw_start_delay,
-            "main": self.draw_main_screen,
-        }
+        # Статичная подпись экрана с крестиком (C2): шрифт и текст
+        # растеризуются один раз при создании менеджера
+        font = pygame.font.Font(None, 36)
+        self._cross_instruction = font.render(
+            "Нажмите ПРОБЕЛ для оценки времени", True, (0, 0, 0)
+        )
+        self._cross_instruction_rect = self._cross_instruction.get_rect(
+            center=(experiment.screen_width // 2, experiment.screen_height - 50)
+        )
+        # Кортеж обработчиков, индексируемый ScreenKind: выбор экрана
+        # на кадре - индексация вместо поиска по строковому ключу
+        self.screen_handlers = (
+            self.draw_initial_instruction,
+            self.draw_timing_screen,
+            self.draw_reproduction_task,
+            self.draw_cross_for_star,
+            self.draw_waiting_for_start,
+            self.draw_start_delay,
+            self.draw_main_screen,
+        )
         # Отключаем дебаг
         self.show_debug = False
 
-    def get_current_screen_type(self):
+    def get_current_screen_type(self) -> ScreenKind:
         """Определение текущего типа экрана"""
         exp = self.experiment
 
@@ -263,28 +365,25 @@ class ScreenManager:
             exp.state.waiting_for_initial_start
             and exp.initial_instruction_screen.is_active
         ):
-            return "initial_instruction"
+            return ScreenKind.INITIAL_INSTRUCTION
         elif exp.timing_screen.is_active:
-            return "timing"
+            return ScreenKind.TIMING
         elif exp.reproduction_task.is_active:
-            return "reproduction"
+            return ScreenKind.REPRODUCTION
         elif exp.showing_cross_for_star:
-            return "cross_for_star"
+            return ScreenKind.CROSS_FOR_STAR
         elif exp.state.waiting_for_movement_start:
-            return "waiting_for_start"
+            return ScreenKind.WAITING_FOR_START
         elif exp.state.in_start_delay:
-            return "start_delay"
+            return ScreenKind.START_DELAY
         else:
-            return "main"
+            return ScreenKind.MAIN
 
     def draw_current_screen(self):
         """Отрисовка текущего экрана"""
-        screen_type = self.get_current_screen_type()
-        handler = self.screen_handlers.get(screen_type)
-        if handler:
-            handler()
-        else:
-            print(f"ОШИБКА: Нет обработчика для типа экрана {screen_type}")
+        # Перечисление покрывает все типы экранов, поэтому обработчик
+        # существует всегда и ветка ошибки не нужна
+        self.screen_handlers[self.get_current_screen_type()]()
 
         # Всегда рисуем индикатор поверх всего
         self.experiment.draw_indicator()
@@ -312,13 +411,8 @@ class ScreenManager:
         if exp.cross_for_star:
             exp.cross_for_star.draw(exp.screen)
 
-        # Инструкция
-        font = pygame.font.Font(None, 36)
-        instruction = font.render("Нажмите ПРОБЕЛ для оценки времени", True, (0, 0, 0))
-        text_rect = instruction.get_rect(
-            center=(exp.screen_width // 2, exp.screen_height - 50)
-        )
-        exp.screen.blit(instruction, text_rect)
+        # Инструкция (растеризована заранее в __init__)
+        exp.screen.blit(self._cross_instruction, self._cross_instruction_rect)
 
     def draw_waiting_for_start(self):
         """Отрисовка экрана ожидания начала движения"""
@@ -363,8 +457,84 @@ class ScreenManager:
 class Experiment:
     """Основной класс эксперимента"""
 
+    # Атрибуты через __slots__: чтение в цикле кадров идет по C-слоту
+    # вместо поиска в __dict__. Новые атрибуты добавлять сюда же.
+    __slots__ = (
+        "BACKGROUND_COLOR",
+        "_dirty",
+        "_frame_time",
+        "_full_flip_area",
+        "_indicator_cache",
+        "_indicator_topleft",
+        "_info_blits",
+        "_info_font",
+        "_info_positions",
+        "_io_executor",
+        "_prev_dirty_rects",
+        "_special_active",
+        "_special_screens",
+        "_static_backdrop",
+        "_trajectory_handler",
+        "_trial_active",
+        "_ui_unlocked",
+        "assigned_speed",
+        "block_manager",
+        "calculated_duration",
+        "clock",
+        "config",
+        "cross_for_star",
+        "cross_for_star_start_time",
+        "current_block",
+        "current_task",
+        "current_trial",
+        "data_collector",
+        "delay_start_time",
+        "fixation",
+        "fixation_preview_screen",
+        "initial_instruction_screen",
+        "key_handler",
+        "minimal_mode",
+        "moving_point",
+        "pending_timing_duration",
+        "photo_sensor_color_active",
+        "photo_sensor_color_occlusion",
+        "photo_sensor_color_passive",
+        "photo_sensor_position",
+        "photo_sensor_radius",
+        "photo_sensor_state",
+        "progress_info",
+        "reproduction_task",
+        "screen",
+        "screen_height",
+        "screen_manager",
+        "screen_width",
+        "showing_cross_for_star",
+        "space_press_time",
+        "start_time",
+        "state",
+        "summary_screen",
+        "timing_screen",
+        "trajectories_data",
+        "trajectory_manager",
+    )
+
+    # Статическая часть справки склеивается один раз, а не при каждом
+    # нажатии H
+    _HELP_STATIC = "\n".join(
+        [
+            "=== Управление ===",
+            "ПРОБЕЛ: Начать движение / остановить точку / продолжить",
+            "H: Показать справку",
+            "S: Сохранить данные",
+            "ESC: Выход",
+        ]
+    )
+
     def __init__(self):
         self.delay_start_time = 0
+        # Фоновый поток для записи данных на диск: основной цикл не
+        # блокируется на сохранении между блоками
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
         self.setup_pygame()
         self.state = ExperimentState()
         self.load_resources()
@@ -374,7 +544,7 @@ class Experiment:
 
         # Объявляем переменные
         self.current_block = None
-        self.current_trial: Dict[str, Any] = {}
+        self.current_trial: Optional[Trial] = None
         self.progress_info: Dict[str, Any] = {}
 
         # Для C2: крестик перед оценкой времени
@@ -386,6 +556,22 @@ class Experiment:
         # Для сводки блока
         self.summary_screen = None
 
+        # Флаг "кадр изменился": пока он не взведен, fill/draw/flip
+        # пропускаются и статичные экраны не перерисовываются
+        self._dirty = True
+
+        # Инкрементальная отрисовка движения: статичный фон кадра и
+        # прямоугольники, занятые точкой и индикатором на прошлом кадре
+        self._static_backdrop = None
+        self._prev_dirty_rects = []
+        # Порог площади, после которого выгоднее полный flip: 0.75
+        # экрана с учетом накладных расходов SDL на каждый прямоугольник
+        self._full_flip_area = int(self.screen_width * self.screen_height * 0.75)
+
+        # Кэшированный флаг "попытка активна": пересчитывается на
+        # переходах состояния, а не на каждом кадре
+        self._refresh_trial_active()
+
     def record_start_delay(self, delay_ms: int):
         """Записывает информацию о задержке перед стартом"""
         if hasattr(self, "data_collector") and self.data_collector:
@@ -399,15 +585,55 @@ class Experiment:
         self.screen_width = display_info.current_w
         self.screen_height = display_info.current_h
 
-        self.screen = pygame.display.set_mode(
-            (self.screen_width, self.screen_height), pygame.NOFRAME
-        )
+        # Аппаратный полноэкранный режим с двойной буферизацией:
+        # драйвер переключает страницы вместо программного копирования
+        # всего кадра через композитор
+        try:
+            self.screen = pygame.display.set_mode(
+                (self.screen_width, self.screen_height),
+                pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.SCALED,
+                vsync=1,
+            )
+        except (pygame.error, TypeError):
+            # Резервный вариант для систем без vsync/SCALED
+            print("⚠️ Аппаратный полноэкранный режим недоступен, используем NOFRAME")
+            self.screen = pygame.display.set_mode(
+                (self.screen_width, self.screen_height), pygame.NOFRAME
+            )
         pygame.mouse.set_visible(False)
         pygame.display.set_caption("Time_exp_v.0.1.0")
-
-        self.BACKGROUND_COLOR = (255, 255, 255)
+        # Хранитель экрана не должен срабатывать посреди блока
+        pygame.display.set_allow_screensaver(False)
+
+        # Пропускаем в очередь только обрабатываемые типы (QUIT и
+        # KEYDOWN), остальное блокируется еще на уровне SDL: мышь,
+        # фокус, KEYUP и прочее не копятся в очереди и не будят
+        # event.wait на статичных экранах
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(_HANDLED_EVENT_TYPES))
+
+        # Готовый pygame.Color: fill() не конвертирует кортеж на каждом кадре
+        self.BACKGROUND_COLOR = pygame.Color(255, 255, 255)
         self.clock = pygame.time.Clock()
 
+        # Шрифт и готовый список блитов информационной панели: текст
+        # меняется только на смене попытки, поэтому и форматирование
+        # строк, и растеризация выполняются один раз за попытку
+        self._info_font = pygame.font.Font(None, 24)
+        self._info_blits = None
+        # Якоря строк панели зависят только от размера экрана,
+        # а он фиксирован на весь запуск - считаем один раз
+        self._info_positions = (
+            (10, self.screen_height - 120),
+            (10, self.screen_height - 95),
+            (10, self.screen_height - 70),
+            (10, self.screen_height - 45),
+        )
+
+        # Единая метка времени кадра: обновляется только в run(),
+        # обработчики читают ее вместо повторных вызовов get_ticks()
+        self._frame_time = pygame.time.get_ticks()
+
     def load_resources(self):
         """Загрузка ресурсов"""
         self.trajectories_data = load_trajectories("traj_lib.json")
@@ -427,8 +653,9 @@ class Experiment:
 
         # Получаем конфигурацию текущей задачи
         self.current_task = self.config.get_current_task_config(
-            self.current_trial["task_type"]
+            self.current_trial.task_type
         )
+        self._select_trajectory_handler()
 
         # Создаем сборщик данных
         self.data_collector = DataCollector(
@@ -450,6 +677,12 @@ class Experiment:
         # Создаем задачу воспроизведения
         self.reproduction_task = ReproductionTask(self.screen_width, self.screen_height)
 
+        # Специальные экраны с общим протоколом обработки (C2, C3)
+        self._special_screens = (
+            (self.timing_screen, self._handle_timing_screen),
+            (self.reproduction_task, self._handle_reproduction_screen),
+        )
+
         # Создаем экран предпоказа фиксационной точки
         self.fixation_preview_screen = FixationPreviewScreen(
             self.screen_width, self.screen_height, self.config.fixation_size
@@ -469,19 +702,54 @@ class Experiment:
         self.photo_sensor_color_active = self.config.photo_sensor_color_active
         self.photo_sensor_color_passive = self.config.photo_sensor_color_passive
         self.photo_sensor_color_occlusion = self.config.photo_sensor_color_occlusion
+        # Смещения отрицательные (центр в правом нижнем углу экрана);
+        # на случай некорректного конфига прижимаем центр к видимой
+        # области, иначе все отрисовки индикатора уходили бы в отсечение
+        sensor_x = self.screen_width + self.config.photo_sensor_offset_x
+        sensor_y = self.screen_height + self.config.photo_sensor_offset_y
+        if self.config.photo_sensor_offset_x >= 0 or self.config.photo_sensor_offset_y >= 0:
+            print(
+                "⚠️ Неотрицательные смещения фото-сенсора "
+                f"({self.config.photo_sensor_offset_x}, {self.config.photo_sensor_offset_y}) "
+                "выводят индикатор за экран, позиция будет ограничена"
+            )
         self.photo_sensor_position = (
-            self.screen_width + self.config.photo_sensor_offset_x,
-            self.screen_height + self.config.photo_sensor_offset_y,
+            max(0, min(self.screen_width - 1, sensor_x)),
+            max(0, min(self.screen_height - 1, sensor_y)),
         )
 
-        # Состояние фотосенсора: active, passive, occlusion
-        self.photo_sensor_state = "passive"
+        # Состояние фотосенсора (PhotoSensor.ACTIVE/PASSIVE/OCCLUSION)
+        self.photo_sensor_state = PhotoSensor.PASSIVE
+
+        # Готовые поверхности индикатора по состояниям: круг с обводкой
+        # растеризуется один раз, на кадре остается только blit; кортеж
+        # индексируется значением PhotoSensor
+        radius = self.photo_sensor_radius
+        side = 2 * (radius + 1)
+        center = (radius + 1, radius + 1)
+        indicator_surfaces = [None, None, None]
+        for state, color in (
+            (PhotoSensor.ACTIVE, self.photo_sensor_color_active),
+            (PhotoSensor.PASSIVE, self.photo_sensor_color_passive),
+            (PhotoSensor.OCCLUSION, self.photo_sensor_color_occlusion),
+        ):
+            surface = pygame.Surface((side, side), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, center, radius)
+            # Черная обводка для контраста
+            pygame.draw.circle(surface, (0, 0, 0), center, radius, 1)
+            # Формат пикселей экрана - быстрый blit без конвертации
+            indicator_surfaces[state] = surface.convert_alpha()
+        self._indicator_cache = tuple(indicator_surfaces)
+        self._indicator_topleft = (
+            self.photo_sensor_position[0] - radius - 1,
+            self.photo_sensor_position[1] - radius - 1,
+        )
 
         # Скрытый переключатель для минималистичного режима
         self.minimal_mode = True
 
-        # Инициализируем время
-        self.start_time = pygame.time.get_ticks()
+        # Инициализируем время кэшированной меткой кадра
+        self.start_time = self._frame_time
         self.space_press_time = 0
 
         # Начинаем первую попытку
@@ -508,7 +776,7 @@ class Experiment:
                 "duration": None,
             }
             self.current_block = None
-            self.current_trial = {}
+            self.current_trial = None
         else:
             self.progress_info = self.block_manager.get_progress_info()
             self.current_block = self.block_manager.get_current_block()
@@ -521,9 +789,9 @@ class Experiment:
                 return
 
             if self.current_task.has_trajectory:
-                block_name = self.current_trial["block_name"]
-                actual_category = self.current_trial["actual_trajectory_category"]
-                trajectory_index = self.current_trial["trajectory_index"]
+                block_name = self.current_trial.block_name
+                actual_category = self.current_trial.actual_trajectory_category
+                trajectory_index = self.current_trial.trajectory_index
 
                 self.trajectory_manager.load_trajectory(
                     block_name, actual_category, trajectory_index
@@ -542,14 +810,14 @@ class Experiment:
             self.calculated_duration = 0
             return
 
-        decoded_params = self.current_trial.get("decoded_params", {})
+        decoded_params = self.current_trial.decoded_params
 
         self.assigned_speed = (
             decoded_params.get("speed")
             if decoded_params.get("speed") is not None
             else (
-                self.current_trial["speed"]
-                if self.current_trial["speed"] is not None
+                self.current_trial.speed
+                if self.current_trial.speed is not None
                 else self.config.available_speeds[0]
             )
         )
@@ -581,6 +849,12 @@ class Experiment:
             )
             return
 
+        # Импорт отложен: moving_point тянет point_math, где при
+        # установленной numba идет компиляция ядра. Откладываем ее до
+        # первой попытки, чтобы окно открывалось сразу, а не после
+        # компиляции
+        from moving_point import MovingPoint
+
         # Создаем точку только если есть траектория с точками
         self.moving_point = MovingPoint(
             self.trajectory_manager.current_trajectory,
@@ -664,6 +938,7 @@ class Experiment:
             print(
                 "Показана фиксационная точка и траектория. Ожидание нажатия ПРОБЕЛ для начала движения."
             )
+            self._refresh_trial_active()
         elif self.current_task.reproduction_task:
             # Для задач воспроизведения НЕ показываем FixationPreviewScreen
             print("Задача воспроизведения (C3) - пропускаем фиксационный превью")
@@ -679,20 +954,12 @@ class Experiment:
             print("Ошибка: нет активного блока")
             return
 
-        # Используем декодированные параметры для определения типа условия
-        decoded_params = self.current_trial.get("decoded_params", {})
-
-        # Определяем тип условия на основе декодированной задачи
-        if decoded_params.get("task_index") == 2:  # C3 - воспроизведение времени
-            condition_type = "reproduction"
-        elif decoded_params.get("task_index") == 1:  # C2 - оценка времени
-            condition_type = "timing_estimation"
-        else:  # C1 - окклюзия или по умолчанию
-            condition_type = (
-                f"occlusion_{self.current_task.occlusion_type}"
-                if self.current_task.occlusion_enabled
-                else "no_occlusion"
-            )
+        # Фон кадра зависит от траектории попытки - собираем заново
+        self._static_backdrop = None
+
+        # Тип условия заранее вычислен на конфигурации задачи -
+        # без конкатенации строк на каждую попытку
+        condition_type = self.current_task.condition_type
 
         # Получаем информацию о задержке из moving_point (если она существует)
         start_delay = 0
@@ -711,7 +978,7 @@ class Experiment:
             ),
             speed=(self.assigned_speed if self.current_task.has_trajectory else 0),
             trajectory_number=(
-                self.current_trial["trajectory_index"]
+                self.current_trial.trajectory_index
                 if self.current_task.has_trajectory
                 else 0
             ),
@@ -719,8 +986,8 @@ class Experiment:
             block_number=self.progress_info["block_number"],
             trial_in_block=self.progress_info["trial_in_block"],
             display_order=self.progress_info["display_order"],
-            assigned_speed=self.current_trial["speed"],
-            assigned_duration=self.current_trial["duration"],
+            assigned_speed=self.current_trial.speed,
+            assigned_duration=self.current_trial.duration,
             start_delay=start_delay,
         )
 
@@ -736,48 +1003,78 @@ class Experiment:
         )
 
         # Получаем декодированные параметры
-        decoded_params = self.current_trial.get("decoded_params", {})
+        decoded_params = self.current_trial.decoded_params if self.current_trial else {}
         decoded_category = decoded_params.get("decoded_category", "N/A")
 
-        info_lines = [
-            f"=== Блок {self.progress_info['block_number']}/{self.progress_info['total_blocks']}: {block_name} ===",
-            f"=== {self.current_task.name} ===",
-            f"Декодированная категория: {decoded_category}",
-            f"Попытка: {self.progress_info['trial_in_block']}/{self.progress_info['total_trials_in_block']} (порядок: {self.progress_info['display_order']})",
-            f"Тип задачи: {'С траекторией' if self.current_task.has_trajectory else 'Без траектории'}",
-            f"Фиксационная точка: {self.current_task.fixation_shape.value}",
-        ]
-
-        if self.current_task.has_trajectory:
-            trajectory_info = self.trajectory_manager.get_current_trajectory_info()
-            info_lines.extend(
-                [
-                    f"Загружена траектория {trajectory_category}[{self.current_trial['trajectory_index']}]",
-                    f"Длина траектории: {trajectory_info.get('total_length', 0):.1f} пикселей",
-                    f"Расчетная продолжительность: {self.calculated_duration:.0f} мс",
-                    f"Назначенная скорость: {self.assigned_speed} px/кадр",
-                    f"Окклюзия: {'ВКЛ' if self.current_task.occlusion_enabled else 'ВЫКЛ'}",
-                ]
-            )
-
-            if self.current_task.occlusion_enabled:
-                info_lines.append(f"Тип окклюзии: {self.current_task.occlusion_type}")
-
-        if self.current_task.timing_estimation:
-            info_lines.append("Оценка времени после остановки: ДА")
-
-        if self.current_task.reproduction_task:
-            info_lines.extend(
-                [
-                    "Воспроизведение времени: ДА",
-                    f"Назначенная длительность: {self.current_trial['duration']} мс",
-                ]
-            )
-
-        if hasattr(self, "moving_point") and self.moving_point is not None:
-            info_lines.append(
-                f"Задержка перед стартом: {self.moving_point.start_delays} мс (случайный выбор)"
-            )
+        task = self.current_task
+        has_trajectory = task.has_trajectory
+        trajectory_info = (
+            self.trajectory_manager.get_current_trajectory_info()
+            if has_trajectory
+            else {}
+        )
+        has_point = getattr(self, "moving_point", None) is not None
+        progress_info = self.progress_info
+
+        # Собираем строки за один проход: необязательные строки дают None
+        # и отбрасываются через filter - без вставок в середину списка
+        info_lines = filter(
+            None,
+            (
+                f"=== Блок {progress_info['block_number']}/{progress_info['total_blocks']}: {block_name} ===",
+                f"=== {task.name} ===",
+                f"Декодированная категория: {decoded_category}",
+                f"Попытка: {progress_info['trial_in_block']}/{progress_info['total_trials_in_block']} (порядок: {progress_info['display_order']})",
+                f"Тип задачи: {'С траекторией' if has_trajectory else 'Без траектории'}",
+                f"Фиксационная точка: {task.fixation_shape.value}",
+                (
+                    f"Загружена траектория {trajectory_category}[{self.current_trial.trajectory_index}]"
+                    if has_trajectory
+                    else None
+                ),
+                (
+                    f"Длина траектории: {trajectory_info.get('total_length', 0):.1f} пикселей"
+                    if has_trajectory
+                    else None
+                ),
+                (
+                    f"Расчетная продолжительность: {self.calculated_duration:.0f} мс"
+                    if has_trajectory
+                    else None
+                ),
+                (
+                    f"Назначенная скорость: {self.assigned_speed} px/кадр"
+                    if has_trajectory
+                    else None
+                ),
+                (
+                    f"Окклюзия: {'ВКЛ' if task.occlusion_enabled else 'ВЫКЛ'}"
+                    if has_trajectory
+                    else None
+                ),
+                (
+                    f"Тип окклюзии: {task.occlusion_type}"
+                    if has_trajectory and task.occlusion_enabled
+                    else None
+                ),
+                (
+                    "Оценка времени после остановки: ДА"
+                    if task.timing_estimation
+                    else None
+                ),
+                ("Воспроизведение времени: ДА" if task.reproduction_task else None),
+                (
+                    f"Назначенная длительность: {self.current_trial.duration} мс"
+                    if task.reproduction_task
+                    else None
+                ),
+                (
+                    f"Задержка перед стартом: {self.moving_point.start_delays} мс (случайный выбор)"
+                    if has_point
+                    else None
+                ),
+            ),
+        )
 
         print("\n".join(info_lines))
 
@@ -793,46 +1090,48 @@ class Experiment:
         """Настройка следующей попытки"""
         self.update_progress_info()
 
+        # Текст информационной панели зависит от попытки - сбрасываем
+        # готовый список блитов
+        self._info_blits = None
+
         # Проверяем, не завершен ли эксперимент
         if self.block_manager.is_experiment_complete():
             print("Эксперимент завершен, нет следующих попыток")
             return
 
         # Используем декодированные параметры из категории траектории
-        decoded_params = self.current_trial.get("decoded_params", {})
+        decoded_params = self.current_trial.decoded_params
         if decoded_params:
             # Переопределяем тип задачи и параметры на основе декодированной категории
-            task_type = decoded_params.get(
-                "task_index", self.current_trial["task_type"]
-            )
+            task_type = decoded_params.get("task_index", self.current_trial.task_type)
             speed = decoded_params.get("speed")
             duration = decoded_params.get("duration")
 
             # ОБНОВЛЯЕМ параметры в текущем испытании
-            self.current_trial["task_type"] = task_type
-            self.current_trial["speed"] = speed
-            self.current_trial["duration"] = duration
+            self.current_trial.task_type = task_type
+            self.current_trial.speed = speed
+            self.current_trial.duration = duration
 
         self.current_task = self.config.get_current_task_config(
-            self.current_trial["task_type"]
+            self.current_trial.task_type
         )
+        self._select_trajectory_handler()
 
         # ОБНОВЛЯЕМ назначенную скорость на основе декодированных параметров
-        decoded_params = self.current_trial.get("decoded_params", {})
         self.assigned_speed = (
             decoded_params.get(
                 "speed"
             )  # Используем скорость из декодированных параметров
             if decoded_params.get("speed") is not None
             else (
-                self.current_trial["speed"]  # Резервный вариант
-                if self.current_trial["speed"] is not None
+                self.current_trial.speed  # Резервный вариант
+                if self.current_trial.speed is not None
                 else self.config.available_speeds[0]
             )
         )
 
         # Сбрасываем состояние фотосенсора при начале новой попытки
-        self.photo_sensor_state = "passive"
+        self.photo_sensor_state = PhotoSensor.PASSIVE
 
         # Обновляем фиксационную точку
         self.fixation.set_shape(self.current_task.fixation_shape)
@@ -866,7 +1165,7 @@ class Experiment:
             self.trajectory_manager.current_trajectory = None
 
         # Сбрасываем состояние
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self._frame_time
         self.state.movement_started = False
         self.state.occlusion_started = False
         self.state.waiting_for_movement_start = False
@@ -889,17 +1188,17 @@ class Experiment:
         elif self.current_task.reproduction_task:
             # Для задач ВОСПРОИЗВЕДЕНИЯ (C3): НЕ показываем FixationPreviewScreen
             # СРАЗУ активируем задачу воспроизведения
-            print(f"=== НАЧАЛО ЗАДАЧИ ВОСПРОИЗВЕДЕНИЯ (C3) ===")
+            log.debug("=== НАЧАЛО ЗАДАЧИ ВОСПРОИЗВЕДЕНИЯ (C3) ===")
 
             # Получаем назначенную длительность
             assigned_duration = (
-                self.current_trial["duration"]
-                if self.current_trial["duration"] is not None
+                self.current_trial.duration
+                if self.current_trial.duration is not None
                 else self.config.available_durations[0]
             )
 
-            print(
-                f"Запуск задачи воспроизведения с длительностью {assigned_duration}мс"
+            log.debug(
+                "Запуск задачи воспроизведения с длительностью %sмс", assigned_duration
             )
 
             # Сразу начинаем задачу воспроизведения
@@ -910,9 +1209,10 @@ class Experiment:
             # Для других задач без траектории (если такие есть)
             self.start_new_trial()
 
+        self._refresh_trial_active()
         self.print_current_trial_info()
 
-    def start_movement_with_delay(self):
+    def start_movement_with_delay(self) -> None:
         """Начинает задержку перед движением точки"""
         # Для всех типов задач с траекторией
 
@@ -925,7 +1225,7 @@ class Experiment:
             self.state.waiting_for_movement_start = False
 
             # Фотосенсор белый во время задержки
-            self.photo_sensor_state = "passive"
+            self.photo_sensor_state = PhotoSensor.PASSIVE
 
             # Запускаем задержку в точке
             self.moving_point.start_movement_with_delay()
@@ -937,13 +1237,15 @@ class Experiment:
             # Запускаем новую попытку (запись данных)
             self.start_new_trial()
 
-    def stop_moving_point(self):
+            self._refresh_trial_active()
+
+    def stop_moving_point(self) -> None:
         """Остановка движущейся точки пользователем (только для задач с траекторией)"""
         if self.moving_point is None:
             return
 
         self.moving_point.stop_by_user()
-        self.space_press_time = pygame.time.get_ticks()
+        self.space_press_time = self._frame_time
 
         was_visible = self.moving_point.is_visible
         self.data_collector.record_space_press(
@@ -952,21 +1254,17 @@ class Experiment:
 
         # Записываем фактическое время движения до остановки
         actual_duration = 0
-        if (
-            self.state.movement_started
-            and self.data_collector.current_trial_data["movement_start_time"]
-        ):
-            actual_duration = (
-                self.space_press_time
-                - self.data_collector.current_trial_data["movement_start_time"]
-            )
+        movement_start_time = self.data_collector.get_movement_start_time()
+        if self.state.movement_started and movement_start_time:
+            actual_duration = self.space_press_time - movement_start_time
             self.data_collector.record_trajectory_duration(actual_duration)
 
         # ДЛЯ ВСЕХ ТИПОВ ЗАДАЧ: определяем дальнейшие действия
         if self.current_task.timing_estimation:
             # Для задач с оценкой времени (звездочка) - показываем крестик
-            print(
-                f"[C2] Задача со звездочкой: показываем крестик. Фактическое время движения: {actual_duration}мс"
+            log.debug(
+                "[C2] Задача со звездочкой: показываем крестик. Фактическое время движения: %sмс",
+                actual_duration,
             )
 
             # Сохраняем фактическое время для оценки
@@ -983,12 +1281,12 @@ class Experiment:
 
             # Устанавливаем флаг показа крестика
             self.showing_cross_for_star = True
-            self.cross_for_star_start_time = pygame.time.get_ticks()
+            self.cross_for_star_start_time = self._frame_time
 
             # Фотосенсор белый для крестика
-            self.photo_sensor_state = "passive"
+            self.photo_sensor_state = PhotoSensor.PASSIVE
 
-            print(
+            log.debug(
                 "[C2] Показан крестик для задачи со звездочкой. Нажмите ПРОБЕЛ для оценки времени."
             )
 
@@ -997,9 +1295,11 @@ class Experiment:
             # СРАЗУ переходим к следующей попытке
             self.complete_and_continue()
 
+        self._refresh_trial_active()
+
         reaction_time = self.space_press_time - self.start_time
 
-    def complete_and_continue(self):
+    def complete_and_continue(self) -> None:
         """Завершает текущую попытку и сразу переходит к следующей"""
         self.data_collector.complete_trial(completed_normally=True)
 
@@ -1041,17 +1341,20 @@ class Experiment:
                     self.save_block_duration_response(duration_response)
 
                 # ВАЖНО: Сохраняем данные ТОЛЬКО текущего блока
-                current_block_data = self.data_collector.get_all_data()
-                
-                # Создаем имя файла для ТОЛЬКО этого блока
-                from utils import save_experiment_data
-                save_experiment_data(
+                # Глубокая копия, чтобы фоновая запись не гонялась
+                # с новым DataCollector следующего блока
+                current_block_data = copy.deepcopy(self.data_collector.get_all_data())
+
+                # Сохраняем в фоновом потоке - следующая попытка
+                # стартует без паузы на запись файла
+                self._io_executor.submit(
+                    save_experiment_data,
                     self.config.participant_id,
                     self.progress_info["block_number"],  # Текущий номер блока
-                    current_block_data  # Только данные этого блока
+                    current_block_data,  # Только данные этого блока
                 )
-                
-                print(f"✅ Данные блока {self.progress_info['block_number']} сохранены")
+
+                print(f"✅ Данные блока {self.progress_info['block_number']} отправлены на сохранение")
 
                 # Скрываем сводку
                 self.summary_screen.deactivate()
@@ -1088,19 +1391,16 @@ class Experiment:
         """Показать информацию о управлении"""
         block_name = self.current_block.name if self.current_block else "N/A"
 
-        help_info = [
-            "=== Управление ===",
-            "ПРОБЕЛ: Начать движение / остановить точку / продолжить",
-            "H: Показать справку",
-            "S: Сохранить данные",
-            "ESC: Выход",
-            f"Текущий блок: {self.progress_info['block_number']}/{self.progress_info['total_blocks']} - {block_name}",
-            f"Текущая задача: {self.current_task.name}",
-            f"Тип: {'С траекторией' if self.current_task.has_trajectory else 'Без траектории'}",
-            f"Прогресс: {self.progress_info['trial_in_block']}/{self.progress_info['total_trials_in_block']} попыток",
-        ]
+        dynamic_tail = "\n".join(
+            [
+                f"Текущий блок: {self.progress_info['block_number']}/{self.progress_info['total_blocks']} - {block_name}",
+                f"Текущая задача: {self.current_task.name}",
+                f"Тип: {'С траекторией' if self.current_task.has_trajectory else 'Без траектории'}",
+                f"Прогресс: {self.progress_info['trial_in_block']}/{self.progress_info['total_trials_in_block']} попыток",
+            ]
+        )
 
-        print("\n".join(help_info))
+        print(self._HELP_STATIC + "\n" + dynamic_tail)
 
     def save_current_data(self):
         """Сохранение текущих данных блока - ТОЛЬКО для текущего блока"""
@@ -1113,17 +1413,16 @@ class Experiment:
             ]
             
             if current_block_data:
-                from utils import save_experiment_data
-                filename = save_experiment_data(
+                # Сохраняем копию в фоновом потоке - клавиша S не
+                # задерживает текущий кадр
+                future = self._io_executor.submit(
+                    save_experiment_data,
                     self.config.participant_id,
                     current_block_number,
-                    current_block_data
+                    copy.deepcopy(current_block_data),
                 )
-                if filename:
-                    print(f"✅ Данные блока {current_block_number} сохранены в {filename}")
-                else:
-                    print(f"❌ Не удалось сохранить данные блока {current_block_number}")
-                return filename
+                print(f"✅ Данные блока {current_block_number} отправлены на сохранение")
+                return future
             else:
                 print(f"⚠️ Нет данных для сохранения в блоке {current_block_number}")
                 return ""
@@ -1131,61 +1430,114 @@ class Experiment:
             print(f"⚠️ Нет данных для сохранения")
             return ""
 
-    def draw_indicator(self):
-        """Рисует индикаторную окружность для фото-сенсора"""
-        # Определяем цвет в зависимости от состояния
-        if self.photo_sensor_state == "passive":
-            color = self.photo_sensor_color_passive  # Белый - пассивное состояние
-        elif self.photo_sensor_state == "occlusion":
-            color = self.photo_sensor_color_occlusion  # Красный при окклюзии
+    def _build_main_backdrop(self):
+        """Собирает статичный фон основного экрана в отдельную поверхность
+
+        Фон, фиксационная точка и траектория не меняются в течение
+        попытки - рендерим их один раз и дальше только восстанавливаем
+        фон под движущимися элементами.
+        """
+        # convert() приводит поверхность к формату пикселей экрана:
+        # восстановление фона идет без поэлементной конвертации
+        backdrop = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        backdrop.fill(self.BACKGROUND_COLOR)
+        self.fixation.draw(backdrop)
+        if self.current_task.has_trajectory and self.trajectory_manager.has_trajectory():
+            self.trajectory_manager.draw_current(backdrop)
+        return backdrop
+
+    def _draw_moving_frame(self) -> None:
+        """Инкрементальная отрисовка кадра с движущейся точкой
+
+        Вместо заливки и перерисовки всего экрана восстанавливаем фон
+        только под прошлыми позициями точки и индикатора и отправляем
+        на дисплей лишь измененные прямоугольники.
+        """
+        screen = self.screen
+        backdrop = self._static_backdrop
+
+        if backdrop is None:
+            # Первый кадр движения: полная композиция + flip
+            backdrop = self._static_backdrop = self._build_main_backdrop()
+            screen.blit(backdrop, (0, 0))
+            new_rects = []
+            point_rect = self.moving_point.draw(screen)
+            if point_rect:
+                new_rects.append(point_rect)
+            new_rects.append(self.draw_indicator())
+            self._prev_dirty_rects = new_rects
+            pygame.display.flip()
+            return
+
+        # Восстанавливаем фон под прошлыми позициями
+        prev_rects = self._prev_dirty_rects
+        for rect in prev_rects:
+            screen.blit(backdrop, rect, rect)
+
+        # Рисуем движущиеся элементы и собираем их новые прямоугольники
+        new_rects = []
+        point_rect = self.moving_point.draw(screen)
+        if point_rect:
+            new_rects.append(point_rect)
+        new_rects.append(self.draw_indicator())
+
+        self._prev_dirty_rects = new_rects
+
+        # Если измененная площадь сравнима с экраном (большой скачок
+        # точки и т.п.), одиночный flip дешевле пообластного update
+        all_rects = prev_rects + new_rects
+        changed_area = sum(rect.w * rect.h for rect in all_rects)
+        if changed_area > self._full_flip_area:
+            pygame.display.flip()
         else:
-            color = self.photo_sensor_color_active  # Черный в активном режиме
-
-        # Рисуем индикатор
-        pygame.draw.circle(
-            self.screen,
-            color,
-            self.photo_sensor_position,
-            self.photo_sensor_radius,
-        )
-        pygame.draw.circle(
-            self.screen,
-            (0, 0, 0),  # Черная обводка для контраста
-            self.photo_sensor_position,
-            self.photo_sensor_radius,
-            1,
-        )
+            pygame.display.update(all_rects)
+
+    def draw_indicator(self):
+        """Рисует индикаторную окружность для фото-сенсора
+
+        Возвращает прямоугольник индикатора для инкрементальной отрисовки.
+        """
+        # Круг с обводкой растеризован заранее в setup_components;
+        # состояние - индекс готовой поверхности в кортеже
+        surface = self._indicator_cache[self.photo_sensor_state]
+        return self.screen.blit(surface, self._indicator_topleft)
 
     def draw_info_panel(self):
         """Отрисовка информационной панели"""
         if self.minimal_mode:
             return
 
-        font = pygame.font.Font(None, 24)
-
-        block_name = self.current_block.name if self.current_block else "N/A"
-
-        info_texts = [
-            f"Задача: {self.current_task.name}",
-            f"Блок: {self.progress_info['block_number']}/{self.progress_info['total_blocks']} - {block_name}",
-            f"Прогресс: {self.progress_info['trial_in_block']}/{self.progress_info['total_trials_in_block']}",
-            f"Тип: {'С траекторией' if self.current_task.has_trajectory else 'Без траектории'}",
-        ]
+        # Строки панели постоянны в пределах попытки: форматируем и
+        # растеризуем их один раз, дальше кадр обходится готовыми
+        # парами (поверхность, позиция). Список сбрасывается в
+        # setup_next_trial
+        blits = self._info_blits
+        if blits is None:
+            block_name = self.current_block.name if self.current_block else "N/A"
+            current_task = self.current_task
+            progress_info = self.progress_info
+
+            info_texts = (
+                f"Задача: {current_task.name}",
+                f"Блок: {progress_info['block_number']}/{progress_info['total_blocks']} - {block_name}",
+                f"Прогресс: {progress_info['trial_in_block']}/{progress_info['total_trials_in_block']}",
+                f"Тип: {'С траекторией' if current_task.has_trajectory else 'Без траектории'}",
+            )
 
-        y_positions = [
-            self.screen_height - 120,
-            self.screen_height - 95,
-            self.screen_height - 70,
-            self.screen_height - 45,
-        ]
+            font = self._info_font
+            blits = self._info_blits = [
+                (font.render(text, True, (0, 0, 0)).convert_alpha(), position)
+                for text, position in zip(info_texts, self._info_positions)
+            ]
 
-        for i, text in enumerate(info_texts):
-            rendered_text = font.render(text, True, (0, 0, 0))
-            self.screen.blit(rendered_text, (10, y_positions[i]))
+        # Один вызов blits вместо четырех blit: меньше переходов
+        # Python <-> C; doreturn=0 - список прямоугольников не нужен
+        self.screen.blits(blits, doreturn=0)
 
     def toggle_minimal_mode(self):
         """Переключает минималистичный режим"""
         self.minimal_mode = not self.minimal_mode
+        self._static_backdrop = None
         mode = "МИНИМАЛИСТИЧНЫЙ" if self.minimal_mode else "ПОЛНЫЙ"
         print(f"Режим переключен: {mode}")
 
@@ -1203,61 +1555,71 @@ class Experiment:
                 self.cross_for_star = None
 
                 # Меняем фотосенсор на черный для оценки времени
-                self.photo_sensor_state = "active"
+                self.photo_sensor_state = PhotoSensor.ACTIVE
 
                 self.timing_screen.activate(self.pending_timing_duration)
+                self._refresh_trial_active()
                 return True
             return False
 
-        # Обработка экрана оценки времени (C2)
-        if self.timing_screen.is_active:
-            if self.timing_screen.handle_event(event):
-                timing_results = self.timing_screen.get_results()
-                self.data_collector.record_timing_estimation(timing_results)
-                self.timing_screen.deactivate()
+        # Общий протокол для специальных экранов (C2, C3):
+        # перебираем только активный экран вместо цепочки elif
+        for screen, handler in self._special_screens:
+            if screen.is_active:
+                return handler(event)
 
-                # После оценки времени сразу переходим к следующей попытке
-                self.complete_and_continue()
-                return True
+        return False
 
-        # Обработка задачи воспроизведения (C3)
-        elif self.reproduction_task.is_active:
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                if hasattr(self.reproduction_task, "state"):
-                    current_state = self.reproduction_task.state
-
-                    # В этих состояниях пробел НЕ должен пропускаться в KeyHandler
-                    states_to_handle = [
-                        "first_cross_waiting",
-                        "second_cross_waiting",
-                        "response_waiting",
-                    ]
-                    if current_state in states_to_handle:
-                        if self.reproduction_task.handle_event(event):
-                            reproduction_results = self.reproduction_task.get_results()
-
-                            # Добавляем задержку из data_collector в результаты
-                            if hasattr(self.data_collector, "get_start_delay"):
-                                reproduction_results["start_delay_from_data"] = (
-                                    self.data_collector.get_start_delay()
-                                )
-
-                            self.data_collector.record_reproduction_results(
-                                reproduction_results
+    def _handle_timing_screen(self, event) -> bool:
+        """Обработка экрана оценки времени (C2)"""
+        if self.timing_screen.handle_event(event):
+            timing_results = self.timing_screen.get_results()
+            self.data_collector.record_timing_estimation(timing_results)
+            self.timing_screen.deactivate()
+
+            # После оценки времени сразу переходим к следующей попытке
+            self.complete_and_continue()
+            self._refresh_trial_active()
+            return True
+        return False
+
+    def _handle_reproduction_screen(self, event) -> bool:
+        """Обработка задачи воспроизведения (C3)"""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            if hasattr(self.reproduction_task, "state"):
+                current_state = self.reproduction_task.state
+
+                # В этих состояниях пробел НЕ должен пропускаться в KeyHandler
+                states_to_handle = [
+                    "first_cross_waiting",
+                    "second_cross_waiting",
+                    "response_waiting",
+                ]
+                if current_state in states_to_handle:
+                    if self.reproduction_task.handle_event(event):
+                        reproduction_results = self.reproduction_task.get_results()
+
+                        # Добавляем задержку из data_collector в результаты
+                        if hasattr(self.data_collector, "get_start_delay"):
+                            reproduction_results["start_delay_from_data"] = (
+                                self.data_collector.get_start_delay()
                             )
 
-                            if hasattr(self.reproduction_task, "deactivate"):
-                                self.reproduction_task.deactivate()
-                            else:
-                                self.reproduction_task.is_active = False
+                        self.data_collector.record_reproduction_results(
+                            reproduction_results
+                        )
 
-                            self.complete_and_continue()
-                            return True
-            return False
+                        if hasattr(self.reproduction_task, "deactivate"):
+                            self.reproduction_task.deactivate()
+                        else:
+                            self.reproduction_task.is_active = False
 
+                        self.complete_and_continue()
+                        self._refresh_trial_active()
+                        return True
         return False
 
-    def update_moving_point(self, dt):
+    def update_moving_point(self, dt: float) -> None:
         """Обновление движущейся точки (только для задач с траекторией)"""
         if not self._can_update_point():
             return
@@ -1266,7 +1628,7 @@ class Experiment:
             # ВСЕГДА обновляем точку - она сама решит, что делать в своем состоянии
             self.moving_point.update(dt)
 
-            current_time = pygame.time.get_ticks()
+            current_time = self._frame_time
 
             # Запись начала окклюзии и изменение цвета фотосенсора
             if (
@@ -1276,23 +1638,28 @@ class Experiment:
             ):
                 self.data_collector.record_occlusion_start(self.moving_point)
                 self.state.occlusion_started = True
-                self.photo_sensor_state = "occlusion"  # Устанавливаем красный цвет
+                self.photo_sensor_state = PhotoSensor.OCCLUSION  # Устанавливаем красный цвет
 
             # Сброс цвета фотосенсора когда точка снова становится видимой
             elif (
                 self.state.occlusion_started
                 and self.moving_point.is_visible
-                and self.photo_sensor_state == "occlusion"
+                and self.photo_sensor_state == PhotoSensor.OCCLUSION
             ):
-                self.photo_sensor_state = "active"  # Возвращаем черный цвет
+                self.photo_sensor_state = PhotoSensor.ACTIVE  # Возвращаем черный цвет
 
             # Проверка завершения траектории
             if self.moving_point.should_switch_to_next():
                 self.handle_trajectory_completion(current_time)
 
-    def _can_update_point(self):
-        """Проверка возможности обновления точки"""
-        return (
+    def _refresh_trial_active(self) -> None:
+        """Пересчитывает кэшированный флаг активности попытки
+
+        Вызывается на переходах состояния (активация/деактивация
+        экранов, смена попытки, остановка точки), чтобы проверка на
+        каждом кадре сводилась к чтению одного атрибута.
+        """
+        self._trial_active = (
             not self.state.waiting_for_initial_start
             and not self.state.waiting_for_movement_start
             and not self.timing_screen.is_active
@@ -1301,54 +1668,95 @@ class Experiment:
             and self.moving_point is not None
             and self.current_task.has_trajectory
         )
+        # Кэш "интерфейс разблокирован": общая статичная часть проверок
+        # _can_stop_point/_can_show_help, которая меняется только на
+        # переходах состояния. Динамические флаги точки (is_moving,
+        # stopped_by_user) здесь не кэшируются - они меняются внутри
+        # moving_point.update() каждый кадр
+        self._ui_unlocked = (
+            not self.state.waiting_for_initial_start
+            and not self.state.waiting_for_movement_start
+            and not self.state.in_start_delay
+            and not self.timing_screen.is_active
+            and not self.reproduction_task.is_active
+        )
+        # Кэш "активен специальный экран": позволяет циклу вообще не
+        # заходить в handle_special_screens для обычных клавиш
+        self._special_active = (
+            self.showing_cross_for_star
+            or self.timing_screen.is_active
+            or self.reproduction_task.is_active
+        )
+        # Любой переход состояния означает смену картинки
+        self._dirty = True
+
+    def _can_update_point(self) -> bool:
+        """Проверка возможности обновления точки"""
+        return self._trial_active
+
+    def _select_trajectory_handler(self) -> None:
+        """Выбирает обработчик завершения траектории для текущей задачи
+
+        Вызывается при смене задачи, чтобы handle_trajectory_completion
+        не проверял флаги задачи на каждом завершении.
+        """
+        self._trajectory_handler = (
+            self.handle_timing_task
+            if self.current_task.timing_estimation
+            else self.handle_regular_task
+        )
 
-    def handle_trajectory_completion(self, current_time):
+    def handle_trajectory_completion(self, current_time: int) -> None:
         """Обработка завершения траектории"""
         actual_duration = current_time - self.start_time
+        # record_movement_end идемпотентен: первое зафиксированное время
+        # сохраняется, повторная запись в обработчиках ничего не делает
         self.data_collector.record_movement_end()
 
         # Сбрасываем состояние фотосенсора при завершении траектории
-        if self.photo_sensor_state == "occlusion":
-            self.photo_sensor_state = "active"
+        if self.photo_sensor_state == PhotoSensor.OCCLUSION:
+            self.photo_sensor_state = PhotoSensor.ACTIVE
 
-        if self.current_task.timing_estimation:
-            # Для задач с оценкой времени при автоматическом завершении
-            self.pending_timing_duration = actual_duration
+        # Обработчик привязан заранее в _select_trajectory_handler
+        self._trajectory_handler(actual_duration, current_time)
 
-            # Создаем крестик для показа
-            self.cross_for_star = FixationCross(
-                self.screen_width,
-                self.screen_height,
-                FixationShape.CROSS,
-                self.config.fixation_size,
-            )
-            self.cross_for_star.set_color(self.config.fixation_color)
+    def handle_timing_task(self, actual_duration: int, current_time: int) -> None:
+        """Обработка завершения траектории для задач с оценкой времени (C2)"""
+        # Для задач с оценкой времени при автоматическом завершении
+        self.pending_timing_duration = actual_duration
 
-            # Устанавливаем флаг показа крестика
-            self.showing_cross_for_star = True
-            self.cross_for_star_start_time = current_time
+        # Создаем крестик для показа
+        self.cross_for_star = FixationCross(
+            self.screen_width,
+            self.screen_height,
+            FixationShape.CROSS,
+            self.config.fixation_size,
+        )
+        self.cross_for_star.set_color(self.config.fixation_color)
 
-            # Фотосенсор белый для крестика
-            self.photo_sensor_state = "passive"
+        # Устанавливаем флаг показа крестика
+        self.showing_cross_for_star = True
+        self.cross_for_star_start_time = current_time
 
-        else:
-            self.handle_regular_task(actual_duration, current_time)
+        # Фотосенсор белый для крестика
+        self.photo_sensor_state = PhotoSensor.PASSIVE
 
-    def handle_regular_task(self, actual_duration, current_time):
+        self._refresh_trial_active()
+
+    def handle_regular_task(self, actual_duration: int, current_time: int) -> None:
         """Обработка регулярной задачи (автоматическое завершение траектории)"""
-        self.data_collector.record_space_press(stopped_by_user=False, was_visible=True)
-        self.data_collector.record_trajectory_duration(actual_duration)
-        self.data_collector.record_movement_end()
+        # Одна пакетная запись вместо трех отдельных record_*
+        self.data_collector.record_regular_completion(actual_duration, current_time)
 
         # ДЛЯ ВСЕХ ТИПОВ ЗАДАЧ: сразу переходим к следующей попытке
         self.complete_and_continue()
 
-    def update_moving_point_logic(self, dt):
+    def update_moving_point_logic(self, dt: float) -> None:
         """Логика для движущейся точки"""
         if self.moving_point is None:
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = self._frame_time
 
         # Запись начала окклюзии
         if (
@@ -1359,19 +1767,19 @@ class Experiment:
             if hasattr(self, "data_collector") and self.data_collector:
                 self.data_collector.record_occlusion_start(self.moving_point)
             self.state.occlusion_started = True
-            self.photo_sensor_state = "occlusion"
+            self.photo_sensor_state = PhotoSensor.OCCLUSION
 
         # Сброс окклюзии
         elif (
             self.state.occlusion_started
             and self.moving_point.is_visible
-            and self.photo_sensor_state == "occlusion"
+            and self.photo_sensor_state == PhotoSensor.OCCLUSION
         ):
-            self.photo_sensor_state = "active"
+            self.photo_sensor_state = PhotoSensor.ACTIVE
 
         # Если точка движется и не в окклюзии - фотосенсор черный
-        elif self.moving_point.is_moving and self.photo_sensor_state != "occlusion":
-            self.photo_sensor_state = "active"
+        elif self.moving_point.is_moving and self.photo_sensor_state != PhotoSensor.OCCLUSION:
+            self.photo_sensor_state = PhotoSensor.ACTIVE
 
         # Проверка завершения траектории
         if self.moving_point.should_switch_to_next():
@@ -1433,28 +1841,63 @@ class Experiment:
                         waiting = False
             pygame.time.delay(100)
 
-    def run(self):
+    def run(self) -> None:
         """Запуск основного цикла эксперимента"""
         print("=== Эксперимент запущен ===")
 
-        while self.state.running:
-            dt = self.clock.tick(60)
-            current_time = pygame.time.get_ticks()
-
-            # Обработка событий
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.state.running = False
-                elif event.type == pygame.KEYDOWN:
+        # Горячие цепочки атрибутов и функции pygame привязываем к
+        # локальным именам один раз: эти объекты после setup_* не
+        # пересоздаются, а локальный доступ дешевле цепочки точек
+        state = self.state
+        clock = self.clock
+        screen = self.screen
+        screen_manager = self.screen_manager
+        reproduction_task = self.reproduction_task
+        background_color = self.BACKGROUND_COLOR
+        get_events = pygame.event.get
+        get_ticks = pygame.time.get_ticks
+        flip = pygame.display.flip
+
+        while state.running:
+            # Пока идет попытка (движение точки или воспроизведение C3) -
+            # точный busy-wait на 60 Гц; на статичных экранах ожидания
+            # хватает грубого tick(30), он отдает CPU системе
+            if self._trial_active or reproduction_task.is_active:
+                dt = clock.tick_busy_loop(60)
+            else:
+                dt = clock.tick(30)
+                # Полностью статичный кадр: спим в ожидании события
+                # вместо опроса очереди, пробуждаемся сразу по клавише
+                if not self._dirty:
+                    idle_event = pygame.event.wait(33)
+                    if idle_event.type != pygame.NOEVENT:
+                        # Возвращаем событие в очередь - его разберет
+                        # общий цикл обработки ниже
+                        pygame.event.post(idle_event)
+            # Единственное место, где опрашивается таймер SDL
+            self._frame_time = current_time = get_ticks()
+
+            # Порядок кадра: события -> обновление мира -> отрисовка.
+            # SPACE фиксируется до update/draw этого же кадра, иначе
+            # время реакции получало бы лишние ~16.6 мс задержки
+            # Обработка событий: в очередь проходят только QUIT и
+            # KEYDOWN (set_allowed в setup_pygame), забираем все сразу
+            for event in get_events():
+                if event.type == _QUIT:
+                    state.running = False
+                elif event.type == _KEYDOWN:
+                    # Любая обработанная клавиша могла изменить экран
+                    self._dirty = True
                     # Обработка экрана сводки блока (если активен)
                     if self.summary_screen and self.summary_screen.is_active:
                         if self.handle_block_summary(event):
                             # Если после обработки сводки экспериментатор завершен
                             if self.block_manager.is_experiment_complete():
-                                self.state.running = False
+                                state.running = False
                             continue
-                    # Обработка специальных экранов (C2, C3)
-                    if self.handle_special_screens(event):
+                    # Обработка специальных экранов (C2, C3): заходим
+                    # только когда какой-то из них действительно активен
+                    if self._special_active and self.handle_special_screens(event):
                         continue
                     else:
                         # Обработка основных клавиш
@@ -1464,67 +1907,97 @@ class Experiment:
             if self.moving_point is not None and self.current_task.has_trajectory:
                 self.moving_point.update(dt)
 
-                # Проверяем, завершилась ли задержка
+                # Пока точка анимируется (задержка, движение, пауза после
+                # финиша) кадр считается измененным
                 if (
-                    self.state.in_start_delay
-                    and not self.moving_point.is_in_start_delay
+                    state.in_start_delay
+                    or self.moving_point.is_moving
+                    or self.moving_point.is_finished
                 ):
-                    self.state.in_start_delay = False
+                    self._dirty = True
+
+                # Проверяем, завершилась ли задержка
+                if state.in_start_delay and not self.moving_point.is_in_start_delay:
+                    state.in_start_delay = False
+                    # Переход состояния: обновляем кэшированные флаги
+                    # (в т.ч. _ui_unlocked для обработчиков клавиш)
+                    self._refresh_trial_active()
 
                     # Меняем фотосенсор на черный при начале движения
-                    self.photo_sensor_state = "active"
+                    self.photo_sensor_state = PhotoSensor.ACTIVE
 
                 # Проверяем, началось ли движение
-                if not self.state.movement_started and self.moving_point.is_moving:
-                    self.state.movement_started = True
-                    if hasattr(self, "data_collector") and self.data_collector:
-                        self.data_collector.record_movement_start()
+                # (data_collector всегда создан в setup_components)
+                if not state.movement_started and self.moving_point.is_moving:
+                    state.movement_started = True
+                    self.data_collector.record_movement_start()
 
                 # Если точка движется, выполняем дополнительную логику
                 if self.moving_point.is_moving:
                     self.update_moving_point_logic(dt)
 
             # Обновление состояния для задачи воспроизведения (C3)
-            if self.reproduction_task.is_active:
-                self.reproduction_task.update()
+            if reproduction_task.is_active:
+                reproduction_task.update()
+                self._dirty = True
 
                 # ИСПРАВЛЕНИЕ: ДЛЯ C3 - правильная логика индикатора
-                if hasattr(self.reproduction_task, "state"):
-                    current_state = self.reproduction_task.state
-
-                    # Состояния с КРЕСТИКОМ - БЕЛЫЙ индикатор:
-                    # - first_cross_waiting (первый крестик с инструкцией)
-                    # - in_start_delay (задержка - крестик без инструкции)
-                    # - second_cross_waiting (второй крестик с инструкцией)
-                    if current_state in [
-                        "first_cross_waiting",
-                        "in_start_delay",
-                        "second_cross_waiting",
-                    ]:
-                        self.photo_sensor_state = "passive"  # Белый
-
-                    # Состояния с КРУГОМ - ЧЕРНЫЙ индикатор:
-                    # - first_circle_auto (круг на декодированное время)
-                    # - response_waiting (круг для ответа с инструкцией)
-                    elif current_state in ["first_circle_auto", "response_waiting"]:
-                        self.photo_sensor_state = "active"  # Черный
-
-            # Отрисовка
-            self.screen.fill(self.BACKGROUND_COLOR)
-
-            # Если активен экран сводки блока, рисуем его
-            if self.summary_screen and self.summary_screen.is_active:
-                self.summary_screen.draw(self.screen)
-            else:
-                # Иначе рисуем текущий экран эксперимента
-                self.screen_manager.draw_current_screen()
+                # (state всегда определен в ReproductionTask.__init__,
+                # probe через hasattr на каждом кадре не нужен)
+                current_state = reproduction_task.state
+
+                # Состояния с КРЕСТИКОМ - БЕЛЫЙ индикатор:
+                # - first_cross_waiting (первый крестик с инструкцией)
+                # - in_start_delay (задержка - крестик без инструкции)
+                # - second_cross_waiting (второй крестик с инструкцией)
+                if current_state in (
+                    "first_cross_waiting",
+                    "in_start_delay",
+                    "second_cross_waiting",
+                ):
+                    self.photo_sensor_state = PhotoSensor.PASSIVE  # Белый
 
-            pygame.display.flip()
+                # Состояния с КРУГОМ - ЧЕРНЫЙ индикатор:
+                # - first_circle_auto (круг на декодированное время)
+                # - response_waiting (круг для ответа с инструкцией)
+                elif current_state in ("first_circle_auto", "response_waiting"):
+                    self.photo_sensor_state = PhotoSensor.ACTIVE  # Черный
+
+            # Отрисовка: статичные кадры не перерисовываем и не ждем
+            # vsync в flip() впустую
+            if self._dirty:
+                self._dirty = False
+
+                if (
+                    self._trial_active
+                    and not state.in_start_delay
+                    and self.minimal_mode
+                    and not (self.summary_screen and self.summary_screen.is_active)
+                ):
+                    # Кадр движения: обновляем только измененные
+                    # прямоугольники поверх статичного фона
+                    self._draw_moving_frame()
+                else:
+                    # Переходные и статичные экраны рисуем целиком
+                    self._static_backdrop = None
+                    screen.fill(background_color)
+
+                    # Если активен экран сводки блока, рисуем его
+                    if self.summary_screen and self.summary_screen.is_active:
+                        self.summary_screen.draw(screen)
+                    else:
+                        # Иначе рисуем текущий экран эксперимента
+                        screen_manager.draw_current_screen()
+
+                    flip()
 
         self.cleanup()
 
     def cleanup(self):
         """Очистка ресурсов"""
+        # Финальную запись отправляем в фоновый поток: запись на диск
+        # перекрывается с остановкой pygame, окно закрывается сразу
+        save_future = None
         try:
             if (
                 hasattr(self, "data_collector")
@@ -1545,39 +2018,52 @@ class Experiment:
                 ):
                     block_number = self.block_manager.current_block_index + 1
 
-                filename = save_experiment_data(
+                save_future = self._io_executor.submit(
+                    save_experiment_data,
                     self.config.participant_id,
                     block_number,
                     self.data_collector.get_all_data(),
                 )
-                print(f"✅ Данные сохранены в файл: {filename}")
             else:
                 print("ℹ️ Нет данных для сохранения")
 
         except Exception as e:
             print(f"❌ Ошибка при сохранении данных: {e}")
-            try:
-                if (
-                    hasattr(self, "data_collector")
-                    and self.data_collector
-                    and self.data_collector.get_all_data()
-                ):
-                    filename = save_experiment_data(
-                        "unknown",
-                        1,
-                        self.data_collector.get_all_data(),
-                    )
-                    print(f"✅ Данные экстренно сохранены в: {filename}")
-            except Exception as e2:
-                print(f"💥 Критическая ошибка сохранения: {e2}")
-
-        pygame.mouse.set_visible(True)
+
+        # В безголовом режиме курсора нет - не дергаем SDL лишний раз
+        if not self.config.headless:
+            pygame.mouse.set_visible(True)
         pygame.quit()
+
+        # Дожидаемся завершения фоновых записей перед выходом
+        self._io_executor.shutdown(wait=True)
+
+        if save_future is not None:
+            try:
+                print(f"✅ Данные сохранены в файл: {save_future.result()}")
+            except Exception as e:
+                print(f"❌ Ошибка при сохранении данных: {e}")
+                try:
+                    if (
+                        hasattr(self, "data_collector")
+                        and self.data_collector
+                        and self.data_collector.get_all_data()
+                    ):
+                        filename = save_experiment_data(
+                            "unknown",
+                            1,
+                            self.data_collector.get_all_data(),
+                        )
+                        print(f"✅ Данные экстренно сохранены в: {filename}")
+                except Exception as e2:
+                    print(f"💥 Критическая ошибка сохранения: {e2}")
+
         sys.exit()
 
 
 def main() -> None:
     """Основная функция"""
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     experiment = Experiment()
     experiment.run()
 
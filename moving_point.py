@@ -1,8 +1,14 @@
 import pygame
+import logging
 from typing import List, Optional, Tuple, Dict, Any
 from trajectory import Trajectory
+from point_math import segment_length, interpolate, step_position
 import random
 
+# Сообщения переходов движения идут через logging с отложенным
+# %-форматированием - на уровне WARNING строки не собираются вовсе
+log = logging.getLogger("time_exp")
+
 
 class MovingPoint:
     def __init__(
@@ -24,6 +30,9 @@ class MovingPoint:
         self.is_finished = False
         self.finished_timer = 0
         self.finished_delay = 900  # мс
+        # Готовый дедлайн паузы после финиша: считается один раз при
+        # остановке, чтобы не вычитать время на каждом кадре
+        self._finished_deadline = 0
         self.stopped_by_user = False
         self.beyond_trajectory = False  # НОВЫЙ ФЛАГ: точка вышла за пределы траектории
 
@@ -166,8 +175,8 @@ class MovingPoint:
         self.is_in_start_delay = True
         self.is_moving = False  # Важно: пока не двигается
 
-        print(f"[DEBUG] Задержка установлена: {self.start_delay}мс")
-        print(f"[DEBUG] Время начала задержки: {self.start_delay_start_time}")
+        log.debug("[DEBUG] Задержка установлена: %sмс", self.start_delay)
+        log.debug("[DEBUG] Время начала задержки: %s", self.start_delay_start_time)
 
         # Возвращаем выбранную задержку для записи в данные
         return self.start_delay
@@ -178,8 +187,9 @@ class MovingPoint:
         self.movement_start_time = pygame.time.get_ticks()
         self.occlusion_started = False
         self.occlusion_active = False
-        print(
-            f"Движение точки началось! Окклюзия начнется через {self.occlusion_delay}мс"
+        log.debug(
+            "Движение точки началось! Окклюзия начнется через %sмс",
+            self.occlusion_delay,
         )
 
     def update(self, dt: float) -> None:
@@ -195,14 +205,14 @@ class MovingPoint:
 
             elapsed_delay = current_time - self.start_delay_start_time
 
-            print(f"[DEBUG] В задержке: {elapsed_delay}/{self.start_delay} мс")
+            log.debug("[DEBUG] В задержке: %s/%s мс", elapsed_delay, self.start_delay)
 
             if elapsed_delay >= self.start_delay:
                 # Задержка завершена, начинаем движение
                 self.is_in_start_delay = False
                 self.is_moving = True
                 self.movement_start_time = current_time
-                print(f"✓ Задержка завершена! Начинаем движение")
+                log.debug("✓ Задержка завершена! Начинаем движение")
                 # Продолжаем выполнение для обновления позиции
             else:
                 # Еще в задержке
@@ -221,7 +231,7 @@ class MovingPoint:
         if self.current_segment >= len(points) - 1:
             # ТОЧКА ДОСТИГЛА КОНЦА ТРАЕКТОРИИ - ПРОДОЛЖАЕМ ДВИЖЕНИЕ ПО ПРЯМОЙ
             self.beyond_trajectory = True
-            print("Точка достигла конца траектории, продолжаем движение по прямой")
+            log.debug("Точка достигла конца траектории, продолжаем движение по прямой")
             self._continue_beyond_trajectory()
             return
 
@@ -232,33 +242,33 @@ class MovingPoint:
         start_point = points[self.current_segment]
         end_point = points[self.current_segment + 1]
 
-        # Вычисляем новую позицию (speed в px/кадр)
-        segment_length = self._segment_length(start_point, end_point)
-        if segment_length > 0:
-            self.progress += self.speed / segment_length
-        else:
-            self.progress = 1.0  # Нулевая длина сегмента
+        # Один вызов численного ядра на кадр: продвижение прогресса и
+        # интерполяция позиции (speed в px/кадр)
+        self.progress, x, y = step_position(
+            start_point[0],
+            start_point[1],
+            end_point[0],
+            end_point[1],
+            self.progress,
+            self.speed,
+        )
 
         if self.progress >= 1.0:
-            # Переходим к следующему сегменту
+            # Сегмент пройден: позиция (x, y) - его конец, он же начало
+            # следующего сегмента
             self.current_segment += 1
             self.progress = 0.0
 
             if self.current_segment >= len(points) - 1:
                 # СЛЕДУЮЩИЙ СЕГМЕНТ - ПОСЛЕДНИЙ, ПОДГОТАВЛИВАЕМСЯ К ВЫХОДУ ЗА ПРЕДЕЛЫ
                 self.beyond_trajectory = True
-                print("Точка достигла конца траектории, продолжаем движение по прямой")
+                log.debug(
+                    "Точка достигла конца траектории, продолжаем движение по прямой"
+                )
                 self._continue_beyond_trajectory()
                 return
 
-            # Обновляем точки для нового сегмента
-            start_point = points[self.current_segment]
-            end_point = points[self.current_segment + 1]
-
-        # Интерполяция позиции
-        self.current_position = self._interpolate_points(
-            start_point, end_point, self.progress
-        )
+        self.current_position = (x, y)
 
     def _continue_beyond_trajectory(self) -> None:
         """Продолжает движение точки за пределы траектории по прямой"""
@@ -311,7 +321,7 @@ class MovingPoint:
                 self.occlusion_started = True
                 self.occlusion_active = True
                 self.is_visible = False
-                print(f"Окклюзия началась! Прошло {elapsed_time}мс")
+                log.debug("Окклюзия началась! Прошло %sмс", elapsed_time)
 
             # Если окклюзия уже началась - точка остается невидимой ДАЖЕ ЗА ПРЕДЕЛАМИ ТРАЕКТОРИИ
             elif self.occlusion_started:
@@ -382,6 +392,7 @@ class MovingPoint:
         self.is_moving = False
         self.is_finished = True
         self.finished_timer = pygame.time.get_ticks()
+        self._finished_deadline = self.finished_timer + self.finished_delay
         # Устанавливаем позицию на последней точке (только если не вышли за пределы)
         if not self.beyond_trajectory and self.trajectory.points:
             self.current_position = self.trajectory.points[-1]
@@ -391,9 +402,9 @@ class MovingPoint:
         if not self.occlusion_active:
             self.is_visible = True
             self.occlusion_active = False
-            print("Движение завершено, точка снова видима")
+            log.debug("Движение завершено, точка снова видима")
         else:
-            print("Движение завершено, точка остается невидимой (была в окклюзии)")
+            log.debug("Движение завершено, точка остается невидимой (была в окклюзии)")
 
     def stop_by_user(self) -> None:
         """Останавливает точку по команде пользователя"""
@@ -401,6 +412,7 @@ class MovingPoint:
             self.is_moving = False
             self.is_finished = True
             self.finished_timer = pygame.time.get_ticks()
+            self._finished_deadline = self.finished_timer + self.finished_delay
             self.stopped_by_user = True
 
             # ВАЖНОЕ ИЗМЕНЕНИЕ: если точка была в окклюзии при остановке, она остается невидимой
@@ -408,31 +420,33 @@ class MovingPoint:
             if self.occlusion_active:
                 # Точка остановлена во время окклюзии - остается невидимой
                 self.is_visible = False
-                print(
+                log.debug(
                     "Точка остановлена пользователем во время окклюзии - остается невидимой"
                 )
             else:
                 # Точка остановлена вне окклюзии - становится видимой
                 self.is_visible = True
-                print(
+                log.debug(
                     "Точка остановлена пользователем вне окклюзии - становится видимой"
                 )
 
     def should_switch_to_next(self):
         """Проверяет, нужно ли переключаться на следующую траекторию"""
-        if self.is_finished:
-            current_time = pygame.time.get_ticks()
-            return current_time - self.finished_timer >= self.finished_delay
-        return False
+        # Сравнение с готовым дедлайном вместо вычитания на каждом кадре
+        return self.is_finished and pygame.time.get_ticks() >= self._finished_deadline
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Рисует движущуюся точку (если она видима)"""
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """Рисует движущуюся точку (если она видима)
+
+        Возвращает прямоугольник, занятый точкой, для инкрементальной
+        отрисовки (или None, если точка не нарисована).
+        """
         if not self.trajectory.points:
-            return
+            return None
 
         # Не рисуем точку, если она не видима
         if not self.is_visible:
-            return
+            return None
 
         color = (255, 0, 0)  # Красная точка по умолчанию
         radius = 8
@@ -441,7 +455,7 @@ class MovingPoint:
         if self.stopped_by_user:
             color = (255, 165, 0)  # Оранжевый
 
-        pygame.draw.circle(
+        return pygame.draw.circle(
             screen,
             color,
             (int(self.current_position[0]), int(self.current_position[1])),
@@ -452,15 +466,13 @@ class MovingPoint:
         self, point1: Tuple[float, float], point2: Tuple[float, float]
     ) -> float:
         """Вычисляет длину сегмента"""
-        return ((point2[0] - point1[0]) ** 2 + (point2[1] - point1[1]) ** 2) ** 0.5
+        return segment_length(point1[0], point1[1], point2[0], point2[1])
 
     def _interpolate_points(
         self, point1: Tuple[float, float], point2: Tuple[float, float], progress: float
     ) -> Tuple[float, float]:
         """Интерполирует позицию между двумя точками"""
-        x = point1[0] + (point2[0] - point1[0]) * progress
-        y = point1[1] + (point2[1] - point1[1]) * progress
-        return (x, y)
+        return interpolate(point1[0], point1[1], point2[0], point2[1], progress)
 
     def reset(self, new_trajectory: Trajectory) -> None:
         """Сбрасывает точку для новой траектории"""
@@ -473,6 +485,7 @@ class MovingPoint:
         self.is_moving = False  # Точка по умолчанию не двигается
         self.is_finished = False
         self.finished_timer = 0
+        self._finished_deadline = 0
         self.stopped_by_user = False
         self.beyond_trajectory = False  # СБРАСЫВАЕМ ФЛАГ
 
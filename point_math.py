@@ -0,0 +1,68 @@
+"""Численное ядро движения точки по траектории.
+
+Скалярная математика вынесена из MovingPoint в функции уровня модуля:
+при установленной numba они компилируются один раз при импорте
+(@njit с явной сигнатурой и cache=True, поэтому повторные запуски
+берут готовый код с диска), без numba работают те же функции на
+чистом Python. pygame-объекты сюда не передаются — numba их не
+типизирует, да и для математики они не нужны.
+"""
+
+
+def segment_length(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Длина сегмента между двумя точками"""
+    return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+
+
+def interpolate(x1: float, y1: float, x2: float, y2: float, progress: float):
+    """Интерполирует позицию между двумя точками"""
+    x = x1 + (x2 - x1) * progress
+    y = y1 + (y2 - y1) * progress
+    return (x, y)
+
+
+def advance_progress(
+    x1: float, y1: float, x2: float, y2: float, progress: float, speed: float
+) -> float:
+    """Продвигает прогресс по сегменту на speed пикселей за кадр"""
+    length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+    if length > 0.0:
+        return progress + speed / length
+    return 1.0  # Нулевая длина сегмента
+
+
+def step_position(
+    x1: float, y1: float, x2: float, y2: float, progress: float, speed: float
+):
+    """Полный шаг кадра по сегменту: продвижение прогресса и интерполяция.
+
+    Возвращает (новый прогресс, x, y). Прогресс ограничен 1.0, поэтому
+    позиция при переполнении совпадает с концом сегмента (он же начало
+    следующего); вызывающий код по progress >= 1.0 переключает сегмент.
+    Одна функция вместо пары advance_progress + interpolate - один
+    переход Python <-> скомпилированный код за кадр.
+    """
+    length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+    if length > 0.0:
+        progress += speed / length
+    else:
+        progress = 1.0
+    if progress > 1.0:
+        progress = 1.0
+    x = x1 + (x2 - x1) * progress
+    y = y1 + (y2 - y1) * progress
+    return (progress, x, y)
+
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    segment_length = njit("f8(f8,f8,f8,f8)", cache=True)(segment_length)
+    interpolate = njit("UniTuple(f8, 2)(f8,f8,f8,f8,f8)", cache=True)(interpolate)
+    advance_progress = njit("f8(f8,f8,f8,f8,f8,f8)", cache=True)(advance_progress)
+    step_position = njit("UniTuple(f8, 3)(f8,f8,f8,f8,f8,f8)", cache=True)(
+        step_position
+    )
@@ -60,9 +60,18 @@ class TrajectoryManager:
     def __init__(self, trajectories_data: Dict[str, Any]):
         self.trajectories_data = trajectories_data
         self.current_trajectory = None
+        # Поверхность текущей траектории с готовой ломаной, стартом и
+        # целью. Ломаная неизменна в пределах попытки, поэтому рисуем ее
+        # линиями один раз, а дальше только блитим. Храним ровно одну
+        # поверхность: прошлые попытки не повторяются, а полноэкранная
+        # SRCALPHA-поверхность на каждую из сотен траекторий съела бы
+        # гигабайты за сессию
+        self._cached_surface = None
 
     def load_trajectory(self, block_name: str, category: str, index: int) -> Trajectory:
         """Загружает траекторию по блоку, категории и индексу"""
+        # Новая траектория - прошлая поверхность больше не актуальна
+        self._cached_surface = None
         try:
             print(f"🔍 Загрузка траектории: {block_name}/{category}[{index}]")
 
@@ -138,9 +147,16 @@ class TrajectoryManager:
     def draw_current(self, screen: pygame.Surface) -> None:
         """Рисует текущую траекторию (только если есть точки)"""
         if self.current_trajectory and len(self.current_trajectory.points) > 1:
-            self.current_trajectory.draw(screen)
-            self.current_trajectory.draw_start_point(screen)
-            self.current_trajectory.draw_target_zone(screen)
+            surface = self._cached_surface
+            if surface is None:
+                surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+                self.current_trajectory.draw(surface)
+                self.current_trajectory.draw_start_point(surface)
+                self.current_trajectory.draw_target_zone(surface)
+                # Приводим к формату экрана - blit без конвертации пикселей
+                surface = surface.convert_alpha()
+                self._cached_surface = surface
+            screen.blit(surface, (0, 0))
 
     def get_current_trajectory_info(self) -> Dict[str, Any]:
         """Возвращает информацию о текущей траектории"""
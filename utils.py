@@ -1,33 +1,66 @@
+import glob
+import hashlib
 import json
 import os
+import pickle
 from datetime import datetime
 from typing import Dict, Any, List
 
 
 def load_trajectories(filename: str = "traj_lib.json") -> Dict[str, Any]:
-    """Загрузка траекторий из JSON файла с сохранением структуры блоков"""
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        print("=" * 60)
-        print("ЗАГРУЖЕНЫ ТРАЕКТОРИИ С БЛОКАМИ:")
-        print("=" * 60)
-
-        # Просто возвращаем данные как есть, сохраняя структуру блоков
-        for block_name in sorted(data.keys()):
-            trajectories_count = sum(len(trajs) for trajs in data[block_name].values())
-            print(f"📦 {block_name}: {trajectories_count} траекторий")
-
-        return data
+    """Загрузка траекторий из JSON файла с сохранением структуры блоков
 
+    Разобранная структура кэшируется в pickle-файл, именованный хэшем
+    содержимого JSON: повторные запуски с тем же файлом траекторий
+    пропускают разбор JSON и берут готовый объект с диска.
+    """
+    try:
+        with open(filename, "rb") as f:
+            raw_bytes = f.read()
     except FileNotFoundError:
         print(f"Файл {filename} не найден!")
         return {}
-    except json.JSONDecodeError as e:
+
+    # Имя кэша привязано к содержимому: при изменении JSON хэш меняется
+    # и старый кэш просто не находится
+    digest = hashlib.blake2b(raw_bytes).hexdigest()[:16]
+    cache_filename = f"{filename}.{digest}.pkl"
+    try:
+        with open(cache_filename, "rb") as f:
+            data = pickle.load(f)
+        print(f"📦 Траектории загружены из кэша: {cache_filename}")
+        return data
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    try:
+        data = json.loads(raw_bytes.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         print(f"Ошибка чтения JSON: {e}")
         return {}
 
+    print("=" * 60)
+    print("ЗАГРУЖЕНЫ ТРАЕКТОРИИ С БЛОКАМИ:")
+    print("=" * 60)
+
+    # Просто возвращаем данные как есть, сохраняя структуру блоков
+    for block_name in sorted(data.keys()):
+        trajectories_count = sum(len(trajs) for trajs in data[block_name].values())
+        print(f"📦 {block_name}: {trajectories_count} траекторий")
+
+    # Пишем кэш и убираем кэши от старых версий файла; ошибки записи
+    # не критичны - следующий запуск снова разберет JSON
+    try:
+        for stale in glob.glob(f"{filename}.*.pkl"):
+            if stale != cache_filename:
+                os.remove(stale)
+        with open(cache_filename, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"⚠️ Не удалось записать кэш траекторий: {e}")
+
+    return data
+
 
 def save_experiment_data(
     participant_id: str, block_number: int, data: List[Dict[str, Any]]